@@ -0,0 +1,201 @@
+"""
+Reproducible solver benchmark - replaces the ad-hoc timing that used to live in test_nodes.py
+
+Runs seeded boards of every size in four flavours:
+
+- uniform: letters drawn uniformly from a-z (what test_averages and the Randomize button produce)
+- weighted: letters drawn by English letter frequency
+- dice: Boggle dice rolls (see classes/Generator.py)
+- dense: letters drawn from a handful of very common letters - worst case, tens of thousands of paths
+
+and reports dictionary load time, per-board solve latency percentiles, peak traced memory and
+the solver's node counts (see classes/Stats.py). Results are written as JSON so runs on different commits can be compared:
+
+    python -m benchmarks.bench_solver -o before.json
+    ... change things ...
+    python -m benchmarks.bench_solver -o after.json --compare before.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import string
+import subprocess
+import sys
+import tracemalloc
+from time import perf_counter, strftime
+
+from classes import Nodes
+from classes.Generator import BoardGenerator
+from classes.Lexicon import build_lexicon, get_lexicon
+
+
+DENSE_LETTERS = 'aeirst'
+KINDS = ('uniform', 'weighted', 'dice', 'dense')
+
+
+def make_board(kind: str, size: int, rng: random.Random) -> list[list[str]]:
+    if kind == 'uniform':
+        letters = [rng.choice(string.ascii_lowercase) for _ in range(size * size)]
+    elif kind in ('weighted', 'dice'):
+        return BoardGenerator('english' if kind == 'weighted' else 'dice', seed=rng).draw(size, size)
+    else:
+        letters = [rng.choice(DENSE_LETTERS) for _ in range(size * size)]
+    return [letters[x * size:(x + 1) * size] for x in range(size)]
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def time_dictionary_load(lexicon_name: str) -> dict[str, float]:
+    """
+    Times building each lexicon backend from scratch (not from the process-wide cache)
+    """
+    from classes.Lexicon import compiled_dawg_path
+    backends = ['trie'] + (['dawg'] if compiled_dawg_path() else [])
+    if lexicon_name not in backends and lexicon_name != 'auto':
+        backends.append(lexicon_name)
+    load_times = {}
+    for backend in backends:
+        start = perf_counter()
+        build_lexicon(backend)
+        load_times[backend] = round(perf_counter() - start, 4)
+    return load_times
+
+
+def run_group(game: Nodes.Game, kind: str, size: int, board_count: int, seed: int, engine: str) -> dict:
+    rng = random.Random(f"{seed}-{kind}-{size}")
+    boards = [make_board(kind, size, rng) for _ in range(board_count)]
+
+    # untimed warm-up - one-time builds (like the scan's word table, the first time 'auto' picks the
+    # scan) would otherwise land in whichever group happens to need them first
+    game.search(boards[0], engine=engine)
+
+    latencies = []
+    words_found = 0
+    for board in boards:
+        start = perf_counter()
+        results = game.search(board, engine=engine)
+        latencies.append((perf_counter() - start) * 1000)
+        words_found += len(results.words_found)
+    latencies.sort()
+
+    # separate passes for memory and node counts - tracing and counting slow the solve down
+    tracemalloc.start()
+    for board in boards:
+        game.search(board, engine=engine)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    # nodes are DFS steps - the scan (which 'auto' picks for some boards) has none, so they're always
+    # counted with the iterative DFS
+    nodes_expanded = prefix_pruned = 0
+    for board in boards:
+        stats = game.search(board, engine='iterative', stats=True).stats
+        nodes_expanded += stats.nodes_expanded # type: ignore
+        prefix_pruned += stats.prefix_pruned # type: ignore
+    lookups = nodes_expanded + prefix_pruned
+
+    return {
+        'kind': kind,
+        'size': size,
+        'boards': board_count,
+        'latency_ms': {
+            'mean': round(sum(latencies) / len(latencies), 3),
+            'p50': round(percentile(latencies, 0.5), 3),
+            'p90': round(percentile(latencies, 0.9), 3),
+            'p99': round(percentile(latencies, 0.99), 3),
+            'max': round(latencies[-1], 3),
+        },
+        'peak_memory_kb': round(peak_memory / 1024, 1),
+        'nodes_expanded_mean': round(nodes_expanded / board_count, 1),
+        'prune_rate': round(prefix_pruned / lookups, 4) if lookups else 0.0,
+        'paths_found_mean': round(words_found / board_count, 1),
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Returns a line for every group whose mean latency grew by more than threshold (e.g. 0.1 = 10%)
+    """
+    baseline_groups = {(group['kind'], group['size']): group for group in baseline['groups']}
+    regressions = []
+    for group in current['groups']:
+        old_group = baseline_groups.get((group['kind'], group['size']))
+        if old_group is None or not old_group['latency_ms']['mean']:
+            continue
+        ratio = group['latency_ms']['mean'] / old_group['latency_ms']['mean']
+        if ratio > 1 + threshold:
+            regressions.append(f"{group['kind']} {group['size']}x{group['size']}: "
+                               f"{old_group['latency_ms']['mean']}ms -> {group['latency_ms']['mean']}ms ({ratio:.2f}x)")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.bench_solver', description="Benchmark the word search solver")
+    parser.add_argument('--sizes', default='2-10', help="board sizes - a range like 2-10 or a list like 4,5")
+    parser.add_argument('--kinds', default=','.join(KINDS), help=f"board kinds to run - any of {', '.join(KINDS)}")
+    parser.add_argument('--boards', type=int, default=20, help="boards per kind and size")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--lexicon', default='auto', help="lexicon backend (auto, dawg, trie, hash)")
+    parser.add_argument('--engine', default=Nodes.DEFAULT_ENGINE, choices=Nodes.ENGINES)
+    parser.add_argument('-o', '--output', default='-', help="JSON output file - stdout by default")
+    parser.add_argument('--compare', help="earlier JSON output to check for latency regressions")
+    parser.add_argument('--threshold', type=float, default=0.1, help="mean latency growth reported as a regression")
+    args = parser.parse_args(argv)
+
+    if '-' in args.sizes:
+        low, high = args.sizes.split('-')
+        sizes = list(range(int(low), int(high) + 1))
+    else:
+        sizes = [int(size) for size in args.sizes.split(',')]
+
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': strftime('%Y-%m-%dT%H:%M:%S'),
+            'seed': args.seed,
+            'lexicon': get_lexicon(args.lexicon).name,
+            'engine': args.engine,
+        },
+        'dictionary_load_s': time_dictionary_load(args.lexicon),
+        'groups': [],
+    }
+    game = Nodes.Game(args.lexicon)
+    for kind in args.kinds.split(','):
+        for size in sizes:
+            group = run_group(game, kind, size, args.boards, args.seed, args.engine)
+            report['groups'].append(group)
+            print(f"{kind:>8} {size:>2}x{size:<2} mean {group['latency_ms']['mean']:>9.3f}ms  "
+                  f"p99 {group['latency_ms']['p99']:>9.3f}ms  nodes {group['nodes_expanded_mean']:>10}", file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    if args.output == '-':
+        print(output)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+Cold start benchmark - how long a fresh process takes to get its first result
+
+Every measurement runs in new Python processes started outside the repository (so nothing depends on
+the working directory), with the repository on PYTHONPATH:
+
+- import: python -X importtime for the solver's entry modules - total time plus the slowest imports
+- first result: import classes.Nodes, create a Game, solve one board - per lexicon backend
+- cli: a whole python -m classes.Batch run for one board, the way a script or service would call it
+
+Medians over --repeat runs are written as JSON:
+
+    python -m benchmarks.bench_startup -o startup.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from time import perf_counter, strftime
+
+from benchmarks.bench_solver import git_commit
+
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENTRY_MODULES = ('classes.Nodes', 'classes.Batch', 'classes.Service')
+BOARD = ['cat', 'dog', 'fox']
+
+FIRST_RESULT = """
+from time import perf_counter
+start = perf_counter()
+from classes.Nodes import Game
+imported = perf_counter()
+game = Game({lexicon!r})
+created = perf_counter()
+results = game.search({board!r})
+solved = perf_counter()
+print(imported - start, created - imported, solved - created, len(results.words_by_character))
+"""
+
+
+def run_python(arguments: list[str], stdin: str = '') -> tuple[subprocess.CompletedProcess, float]:
+    """
+    Runs a fresh interpreter outside the repository - returns the finished process and its wall time in seconds
+    """
+    environment = dict(os.environ, PYTHONPATH=REPOSITORY)
+    with tempfile.TemporaryDirectory() as directory:
+        start = perf_counter()
+        process = subprocess.run([sys.executable, *arguments], input=stdin, capture_output=True,
+                                 text=True, cwd=directory, env=environment)
+        elapsed = perf_counter() - start
+    if process.returncode:
+        raise RuntimeError(f"python {' '.join(arguments)} failed:\n{process.stderr}")
+    return process, elapsed
+
+
+def import_times(module: str, repeat: int, top: int = 8) -> dict:
+    """
+    Median cumulative import time of a module (ms) and its slowest imports by self time in the last run
+    """
+    totals = []
+    for _ in range(repeat):
+        process, _ = run_python(['-X', 'importtime', '-c', f'import {module}'])
+        rows = []
+        for line in process.stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            rows.append((int(self_us), int(cumulative_us), name.strip()))
+        totals.append(next(cumulative for _, cumulative, name in rows if name == module) / 1000)
+    slowest = sorted(rows, reverse=True)[:top]
+    return {
+        'total_ms': round(statistics.median(totals), 2),
+        'slowest_self_ms': {name: round(self_us / 1000, 2) for self_us, _, name in slowest},
+    }
+
+
+def first_result(lexicon: str, repeat: int) -> dict:
+    """
+    Median import, Game() and first solve times plus whole-process wall time (ms) for a lexicon backend
+    """
+    runs = []
+    for _ in range(repeat):
+        process, elapsed = run_python(['-c', FIRST_RESULT.format(lexicon=lexicon, board=BOARD)])
+        import_s, create_s, solve_s, _ = process.stdout.split()
+        runs.append((float(import_s), float(create_s), float(solve_s), elapsed))
+    medians = [round(statistics.median(column) * 1000, 2) for column in zip(*runs)]
+    return dict(zip(('import_ms', 'game_ms', 'first_solve_ms', 'process_ms'), medians))
+
+
+def cli_run(repeat: int) -> dict:
+    """
+    Median wall time (ms) of a whole single-board python -m classes.Batch run
+    """
+    times = [run_python(['-m', 'classes.Batch', '-w', '1'], stdin=' '.join(BOARD) + '\n')[1] for _ in range(repeat)]
+    return {'process_ms': round(statistics.median(times) * 1000, 2)}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.bench_startup', description="Benchmark cold start to first result")
+    parser.add_argument('--repeat', type=int, default=5, help="fresh processes per measurement")
+    parser.add_argument('--lexicons', default='auto,trie,hash', help="lexicon backends to time a first result with")
+    parser.add_argument('-o', '--output', default='-', help="JSON output file - stdout by default")
+    args = parser.parse_args(argv)
+
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': strftime('%Y-%m-%dT%H:%M:%S'),
+            'repeat': args.repeat,
+        },
+        'import': {module: import_times(module, args.repeat) for module in ENTRY_MODULES},
+        'first_result': {lexicon: first_result(lexicon, args.repeat) for lexicon in args.lexicons.split(',')},
+        'cli': cli_run(args.repeat),
+    }
+    for module, times in report['import'].items():
+        print(f"import {module:<16} {times['total_ms']:>8.2f}ms", file=sys.stderr)
+    for lexicon, times in report['first_result'].items():
+        print(f"first result ({lexicon:<5}) {times['process_ms']:>8.2f}ms  (solve {times['first_solve_ms']:.2f}ms)", file=sys.stderr)
+    print(f"python -m classes.Batch {report['cli']['process_ms']:>8.2f}ms", file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    if args.output == '-':
+        print(output)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,216 @@
+"""
+Contains the batch solve API and command line tool for solving many boards at high throughput:
+
+- parse_board(): reads a board from one line of input (plain text or JSON)
+- read_boards(): reads every board of an input, skipping lines that aren't one
+- normalize_board(): checks and lowercases a board given as a list of columns
+- solve_many(): solves an iterable of boards, yielding one compact JSON-ready record per board
+- command line interface (python -m classes.Batch boards.txt -o results.jsonl)
+
+Notes:
+Boards use the same layout as Game.find_words - each row string / inner list of the input is a
+column of the grid, and coordinates in the output are (x, y) pairs. Plain text lines separate the
+columns with whitespace, commas or slashes ("cat dog fox"); JSON lines are either a list
+(["cat", "dog", "fox"] / [["c", "a", "t"], ...]) or an object with a "board" key.
+Blocked cells are written as '.' or '#' ("c.t dog f#x"); multi-letter tiles need the JSON list of
+lists form ([["qu", "a"], ...]). The command line tool reports invalid lines on stderr and carries on.
+
+Results stream out in input order and are never collected - only a bounded window of boards is
+in flight at once. With more than one worker, chunks of boards are solved on the shared process
+pool from Parallel.py, so every worker reuses the lexicon loaded (or mapped) by the parent.
+Repeated boards (including rotations/reflections) are answered from an LRU ResultCache - one per process.
+With prefilter set, each chunk is solved at once by the NumPy prefilter in Prefilter.py instead (no cache).
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import deque
+from time import perf_counter
+from typing import Any, Iterable, Iterator
+
+from classes.Board import Board
+from classes.Cache import ResultCache
+from classes.Lexicon import DEFAULT_LEXICON, Lexicon, get_lexicon
+from classes.Nodes import Game, SearchResults
+
+
+def parse_board(line: str) -> list[list[str]]:
+    """
+    Reads a board from one line of plain text or JSON - returns a 2d array of characters (columns)
+    """
+    line = line.strip()
+    if line[:1] in '[{':
+        board: Any = json.loads(line)
+        if isinstance(board, dict):
+            board = board['board']
+    else:
+        board = [column for column in re.split(r'[\s,/]+', line) if column]
+    return normalize_board(board)
+
+
+def normalize_board(board: list) -> list[list[str]]:
+    """
+    Lowercases a board of column strings / lists of characters - raises ValueError unless it's a
+    rectangular board the solver can take (see Board.py)
+    """
+    board = [[character.lower() for character in column] for column in board]
+    if not board or any(len(column) != len(board[0]) for column in board):
+        raise ValueError(f"Boards must be rectangular: {board!r}")
+    Board(board) # caught here rather than in a worker
+    return board
+
+
+def read_boards(lines: Iterable[str], skipped: list[int]) -> Iterator[list[list[str]]]:
+    """
+    Yields the board on every non-blank line - lines that aren't a valid board are reported on stderr,
+    their (1-based) numbers appended to skipped, and passed over
+    """
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            board = parse_board(line)
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            skipped.append(line_number)
+            print(f"line {line_number}: skipped - {error}", file=sys.stderr)
+            continue
+        yield board
+
+
+def result_record(board: list[list[str]], results: SearchResults, include_paths: bool = False) -> dict:
+    """
+    Turns a search's results into a compact, JSON serializable record
+    """
+    # boards with multi-letter tiles (or empty cells) only read back the same in list of lists form
+    single_letters = all(len(character) == 1 for column in board for character in column)
+    record = {
+        'board': [''.join(column) for column in board] if single_letters else board,
+        'word_count': len(results.words_by_character),
+        'words': list(results.words_by_character),
+        'longest_word': results.longest_word.word,
+        'longest_path': results.coordinates(results.longest_word.path),
+        'score': results.score,
+        'search_time': results.search_time,
+    }
+    if include_paths:
+        record['paths'] = [[found_word.word, results.coordinates(found_word.path)] for found_word in results.words_found]
+    return record
+
+
+_worker_cache: ResultCache | None = None
+
+
+def solve_boards(boards: list[list[list[str]]], lexicon: Lexicon, include_paths: bool = False,
+                 cache: ResultCache | None = None, prefilter: bool = False) -> list[dict]:
+    """
+    Solves a chunk of boards - one after another, or all together with the NumPy prefilter
+    """
+    game = Game(lexicon, cache)
+    if prefilter:
+        from classes.Prefilter import solve_boards as prefilter_boards
+        all_results = prefilter_boards(boards, game, unique_words=not include_paths)
+        return [result_record(board, results, include_paths) for board, results in zip(boards, all_results)]
+    return [result_record(board, game.search(board, unique_words=not include_paths), include_paths) for board in boards]
+
+
+def solve_boards_in_worker(boards: list[list[list[str]]], include_paths: bool, cache_size: int,
+                           prefilter: bool = False) -> list[dict]:
+    """
+    solve_boards() for a task on the shared process pool - uses the worker's lexicon and its own cache
+    """
+    global _worker_cache
+    from classes.Parallel import worker_lexicon
+    if cache_size and _worker_cache is None:
+        _worker_cache = ResultCache(cache_size)
+    return solve_boards(boards, worker_lexicon(), include_paths, _worker_cache if cache_size else None, prefilter)
+
+
+def _chunks(boards: Iterable[list[list[str]]], chunksize: int) -> Iterator[list[list[list[str]]]]:
+    chunk = []
+    for board in boards:
+        chunk.append(board)
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def solve_many(boards: Iterable[list[list[str]]], workers: int | None = 1, chunksize: int = 16,
+               include_paths: bool = False, lexicon: str | Lexicon = DEFAULT_LEXICON,
+               cache_size: int = 1024, prefilter: bool = False) -> Iterator[dict]:
+    """
+    Solves every board, yielding one record per board in input order (see result_record())
+
+    Only one path is kept per word unless include_paths is set. workers=None uses every CPU; with
+    more than one worker, boards are sent to the process pool chunksize at a time, with at most
+    two chunks per worker in flight so neither the input nor the output is ever held in full.
+    cache_size bounds each process's cache of solved boards - 0 disables it.
+    prefilter solves each chunk with the NumPy batch prefilter (raises ImportError without NumPy) -
+    it pays off with large chunks of small boards.
+    """
+    if prefilter:
+        from classes.Prefilter import require_numpy
+        require_numpy()
+    lexicon = get_lexicon(lexicon) if isinstance(lexicon, str) else lexicon
+    if not workers:
+        from classes.Parallel import default_workers
+        workers = default_workers()
+
+    if workers == 1:
+        cache = ResultCache(cache_size) if cache_size else None
+        for chunk in _chunks(boards, chunksize):
+            yield from solve_boards(chunk, lexicon, include_paths, cache, prefilter)
+        return
+
+    # multiprocessing is only imported once there's a pool to run
+    from classes.Parallel import get_pool
+    pool = get_pool(workers, lexicon)
+    pending = deque()
+    for chunk in _chunks(boards, chunksize):
+        pending.append(pool.submit(solve_boards_in_worker, chunk, include_paths, cache_size, prefilter))
+        if len(pending) >= workers * 2:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m classes.Batch', description="Solve many boards, streaming results out as JSONL")
+    parser.add_argument('input', nargs='?', default='-', help="file with one board per line (plain text or JSON) - stdin by default")
+    parser.add_argument('-o', '--output', default='-', help="JSONL output file - stdout by default")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="worker processes - every CPU by default")
+    parser.add_argument('-c', '--chunksize', type=int, default=16, help="boards sent to a worker at a time")
+    parser.add_argument('--paths', action='store_true', help="include every path for every word")
+    parser.add_argument('--lexicon', default=DEFAULT_LEXICON, help="lexicon backend (auto, dawg, trie, hash)")
+    parser.add_argument('--cache-size', type=int, default=1024, help="solved boards cached per process - 0 disables the cache")
+    parser.add_argument('--prefilter', action='store_true', help="solve each chunk with the NumPy batch prefilter")
+    args = parser.parse_args(argv)
+
+    input_file = sys.stdin if args.input == '-' else open(args.input)
+    output_file = sys.stdout if args.output == '-' else open(args.output, 'w')
+    skipped: list[int] = []
+    boards = read_boards(input_file, skipped)
+
+    start_time = perf_counter()
+    board_count = 0
+    try:
+        for record in solve_many(boards, args.workers, args.chunksize, args.paths, args.lexicon, args.cache_size, args.prefilter):
+            output_file.write(json.dumps(record) + '\n')
+            board_count += 1
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+    elapsed = perf_counter() - start_time
+    rate = board_count / elapsed if elapsed else 0.0
+    print(f"{board_count} boards in {elapsed:.2f} seconds ({rate:.1f} boards/sec)"
+          + (f", {len(skipped)} invalid lines skipped" if skipped else ''), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
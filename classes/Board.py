@@ -0,0 +1,153 @@
+"""
+Contains the compact board representation the solvers run on:
+
+- Board: grid characters held in a flat bytes buffer plus a shared neighbor index table
+- grid_neighbor_table(): neighbor indices for every cell of a full grid - computed once per size
+- neighbor_table(): neighbor indices for every cell of a board shape (size plus blocked cells)
+- open_cells(): the flat indices of a board shape's usable cells
+
+Notes:
+Cells are identified by flat indices: index = x * height + y (inner lists of the 2d character
+array are columns, so height is the number of letters in each column). Neighbors are listed in
+the same order Search.set_neighbors has always used, so every solver visits paths in the same order.
+
+Boards can be rectangular, and cells can be blocked - an empty/None cell, ' ', '.' or '#', or a cell
+missing from a column shorter than the others. Blocked cells hold code 0 and never appear in the
+neighbor table, so solvers need no bounds or blocked checks. Only full grids' neighbor tables are
+cached (per width x height) and shared by every board of that size - boards with blocked cells filter
+theirs out of it when they're built, since boards from outside can have any number of blocked patterns.
+
+Cells can also hold multi-letter tiles such as "qu" or "th" (anything but a single ASCII character).
+Each distinct tile on a board gets a code from TILE_BASE up - tiles[code - TILE_BASE] is its text -
+and the solver walks the lexicon a whole tile at a time (see Search.step_function). Word lengths
+always count letters, so a "qu" cell adds two.
+
+Solvers track the cells used by the current path with an int bitmask (bit n set = cell n used).
+"""
+
+from functools import lru_cache
+
+
+BLOCKED_CHARACTERS = frozenset(('', ' ', '.', '#')) # characters marking a cell that can't be used
+BLOCKED = 0 # character code stored for blocked cells
+TILE_BASE = 128 # codes from here up stand for multi-letter tiles - see Board.tiles
+
+
+@lru_cache(maxsize=None)
+def grid_neighbor_table(width: int, height: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Returns the flat indices of the cells touching each cell (sides or corners) of a full width x height grid
+    """
+    return tuple(
+        tuple(
+            (x + i) * height + (y + j)
+            for i in range(-1, 2)
+            for j in range(-1, 2)
+            if (i or j) and 0 <= x + i < width and 0 <= y + j < height
+        )
+        for x in range(width)
+        for y in range(height)
+    )
+
+
+def neighbor_table(width: int, height: int, blocked: int = 0) -> tuple[tuple[int, ...], ...]:
+    """
+    Returns the flat indices of the open cells touching each cell (sides or corners) of a width x height grid
+
+    blocked is the bitmask of blocked cells - they have no neighbors and are nobody's neighbor
+    """
+    table = grid_neighbor_table(width, height)
+    if not blocked:
+        return table
+    return tuple(
+        () if blocked >> index & 1 else tuple(neighbor for neighbor in neighbors if not blocked >> neighbor & 1)
+        for index, neighbors in enumerate(table)
+    )
+
+
+def open_cells(width: int, height: int, blocked: int = 0) -> tuple[int, ...]:
+    """
+    Returns the flat indices of the cells of a width x height grid that aren't blocked
+    """
+    return tuple(index for index in range(width * height) if not blocked >> index & 1)
+
+
+class Board():
+    """
+    A game grid stored as a flat buffer of character codes
+    """
+    cells: bytes # character code of each cell, by flat index
+    width: int # number of columns (x coordinates)
+    height: int # number of letters per column (y coordinates)
+    blocked: int # bitmask of blocked cells
+    tiles: tuple[str, ...] # multi-letter tiles on the board, sorted - cell code TILE_BASE + n is tiles[n]
+    neighbors: tuple[tuple[int, ...], ...] # flat indices of each cell's neighbors - shared by all boards of this shape
+    open_cells: tuple[int, ...] # flat indices of the usable cells - the starting cells of a search
+
+    __slots__ = ('cells', 'width', 'height', 'blocked', 'tiles', 'neighbors', 'open_cells')
+
+    def __init__(self, characters_2d: list[list[str]]):
+        self.width = len(characters_2d)
+        self.height = max(map(len, characters_2d), default=0)
+        self.tiles = tuple(sorted({
+            character for column in characters_2d for character in column
+            if character and (len(character) > 1 or ord(character) >= TILE_BASE)
+        }))
+        if len(self.tiles) > 256 - TILE_BASE:
+            raise ValueError(f"A board can hold at most {256 - TILE_BASE} distinct multi-letter tiles")
+        tile_codes = {tile: TILE_BASE + n for n, tile in enumerate(self.tiles)}
+
+        cells = bytearray()
+        blocked = 0
+        for column in characters_2d:
+            for character in column:
+                if character is None or character in BLOCKED_CHARACTERS:
+                    blocked |= 1 << len(cells)
+                    cells.append(BLOCKED)
+                elif character in tile_codes:
+                    cells.append(tile_codes[character])
+                else:
+                    cells.append(ord(character))
+            # short columns are padded with blocked cells
+            for _ in range(self.height - len(column)):
+                blocked |= 1 << len(cells)
+                cells.append(BLOCKED)
+        self.cells = bytes(cells)
+        self.blocked = blocked
+        self.neighbors = neighbor_table(self.width, self.height, blocked)
+        self.open_cells = open_cells(self.width, self.height, blocked)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def character(self, index: int) -> str:
+        """
+        Returns the character (or tile) of a cell - '' for a blocked cell
+        """
+        code = self.cells[index]
+        if code >= TILE_BASE:
+            return self.tiles[code - TILE_BASE]
+        return chr(code) if code != BLOCKED else ''
+
+    def letter_count(self) -> int:
+        """
+        Returns the number of letters on the board's open cells - a "qu" tile counts two
+        """
+        if not self.tiles:
+            return len(self.open_cells)
+        return sum(len(self.character(index)) for index in self.open_cells)
+
+    def coordinates(self, index: int) -> tuple[int, int]:
+        """
+        Converts a flat index into (x, y) coordinates
+        """
+        return divmod(index, self.height)
+
+    def to_2d(self) -> list[list[str]]:
+        """
+        Returns the board as a 2d array of characters - inner lists are columns, blocked cells are ''
+        """
+        return [
+            [self.character(index) for index in range(x * self.height, (x + 1) * self.height)]
+            for x in range(self.width)
+        ]
@@ -0,0 +1,181 @@
+"""
+Contains the result cache for repeated boards:
+
+- symmetries(): the 8 rotations/reflections of a grid size as flat index permutations
+- canonical_form(): the symmetry of a board with the smallest key, plus the permutation that produces it
+- ResultCache: bounded LRU cache of solved boards, in memory with an optional on-disk (SQLite) tier
+
+Notes:
+Boards that are rotations or reflections of each other share one entry - words are stored with their
+paths in the canonical board's index space and mapped back through the inverse permutation on a hit.
+A hit has the same words and paths as a fresh solve, but words_found may be in a different order.
+
+Entries always hold a full solve (every path, no length cap) so any unique_words / max_length
+request can be served from them. Keys start with the lexicon's fingerprint, so entries made with
+another word list are never returned - changing the dictionary invalidates the cache.
+"""
+
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+
+from classes.Board import Board
+from classes.Lexicon import Lexicon
+from classes.Nodes import FoundWord
+
+
+@lru_cache(maxsize=None)
+def symmetries(width: int, height: int) -> tuple[tuple[int, int, tuple[int, ...]], ...]:
+    """
+    Returns (new width, new height, permutation) for each rotation/reflection of a width x height grid
+
+    permutation[i] is the flat index cell i moves to
+    """
+    transforms = [
+        lambda x, y: (x, y),
+        lambda x, y: (width - 1 - x, y),
+        lambda x, y: (x, height - 1 - y),
+        lambda x, y: (width - 1 - x, height - 1 - y),
+        # transposed - width and height swap
+        lambda x, y: (y, x),
+        lambda x, y: (height - 1 - y, x),
+        lambda x, y: (y, width - 1 - x),
+        lambda x, y: (height - 1 - y, width - 1 - x),
+    ]
+    results = []
+    for i, transform in enumerate(transforms):
+        new_width, new_height = (width, height) if i < 4 else (height, width)
+        permutation = []
+        for x in range(width):
+            for y in range(height):
+                new_x, new_y = transform(x, y)
+                permutation.append(new_x * new_height + new_y)
+        results.append((new_width, new_height, tuple(permutation)))
+    return tuple(results)
+
+
+def canonical_form(board: Board) -> tuple[str, tuple[int, ...]]:
+    """
+    Returns the key of the board's canonical symmetry and the permutation mapping the board onto it
+    """
+    best_key = None
+    best_permutation = ()
+    for width, height, permutation in symmetries(board.width, board.height):
+        cells = bytearray(len(board.cells))
+        for index, code in enumerate(board.cells):
+            cells[permutation[index]] = code
+        key = f"{width}x{height}:{cells.hex()}"
+        if board.tiles:
+            # tile codes only mean something alongside the board's tile list
+            key += ':' + ','.join(board.tiles)
+        if best_key is None or key < best_key:
+            best_key, best_permutation = key, permutation
+    return best_key or '', best_permutation
+
+
+class ResultCache():
+    """
+    Bounded LRU cache of full solves keyed by canonical board - thread-safe
+
+    path: optional SQLite file for a second, unbounded tier that outlives the process
+    """
+    maxsize: int # most boards kept in memory
+    path: str | None # on-disk tier - None keeps everything in memory
+    hits: int # lookups answered from memory
+    disk_hits: int # lookups answered from the on-disk tier
+    misses: int # lookups that needed a solve
+    evictions: int # entries dropped from memory to respect maxsize
+    entries: OrderedDict[str, tuple[FoundWord, ...]] # in-memory tier - least recently used first
+    lock: Lock
+    connection: 'sqlite3.Connection | None' # on-disk tier
+
+    def __init__(self, maxsize: int = 256, path: str | None = None):
+        self.maxsize = maxsize
+        self.path = path
+        self.entries = OrderedDict()
+        self.lock = Lock()
+        self.hits = self.disk_hits = self.misses = self.evictions = 0
+        self.connection = None
+        if path is not None:
+            import sqlite3
+            self.connection = sqlite3.connect(path, check_same_thread=False)
+            self.connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, words TEXT NOT NULL)")
+            self.connection.commit()
+
+    def key(self, board: Board, lexicon: Lexicon) -> tuple[str, tuple[int, ...]]:
+        board_key, permutation = canonical_form(board)
+        return f"{lexicon.fingerprint}:{board_key}", permutation
+
+    def get(self, board: Board, lexicon: Lexicon) -> list[FoundWord] | None:
+        """
+        Returns the cached words for a board (paths in the board's own index space), or None on a miss
+        """
+        key, permutation = self.key(board, lexicon)
+        with self.lock:
+            found_words = self.entries.get(key)
+            if found_words is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+            elif self.connection is not None:
+                row = self.connection.execute("SELECT words FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    found_words = tuple(FoundWord(word, tuple(path)) for word, path in json.loads(row[0]))
+                    self.store(key, found_words)
+                    self.disk_hits += 1
+            if found_words is None:
+                self.misses += 1
+                return None
+
+        inverse = [0] * len(permutation)
+        for index, canonical_index in enumerate(permutation):
+            inverse[canonical_index] = index
+        return [FoundWord(word, tuple(inverse[index] for index in path)) for word, path in found_words]
+
+    def put(self, board: Board, lexicon: Lexicon, found_words: list[FoundWord]) -> None:
+        """
+        Caches a full solve of the board - paths in the board's own index space
+        """
+        key, permutation = self.key(board, lexicon)
+        canonical_words = tuple(FoundWord(word, tuple(permutation[index] for index in path)) for word, path in found_words)
+        with self.lock:
+            self.store(key, canonical_words)
+            if self.connection is not None:
+                self.connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?)", (key, json.dumps(canonical_words)))
+                self.connection.commit()
+
+    def store(self, key: str, found_words: tuple[FoundWord, ...]) -> None:
+        """
+        Adds an entry to the in-memory tier, evicting the least recently used ones past maxsize
+        Caller holds the lock
+        """
+        self.entries[key] = found_words
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Empties both tiers
+        """
+        with self.lock:
+            self.entries.clear()
+            if self.connection is not None:
+                self.connection.execute("DELETE FROM results")
+                self.connection.commit()
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Hit/miss metrics
+        """
+        with self.lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'size': len(self.entries),
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,231 @@
+"""
+Contains the precompiled, memory-mapped dictionary format:
+
+- compile_words(): minimizes a word list into a DAWG and packs it into a flat array of edges
+- DawgLexicon: Lexicon backend reading the packed edges straight out of a buffer (usually an mmap)
+- build/info command line interface (python -m classes.Dawg build)
+
+Notes:
+File layout (little-endian):
+
+    bytes 0-7    magic b'WHDAWG01'
+    bytes 8-11   number of edges (uint32)
+    bytes 12-15  crc32 of the word list the file was compiled from (uint32)
+    bytes 16-    edges (uint32 each)
+
+Each edge packs | target's first edge index (22 bits) | terminal (1 bit) | last (1 bit) | character code (8 bits) |
+- terminal: the node the edge leads to ends a word
+- last: the edge is the final one in its node's edge list (lists are sorted by character code)
+- target index 0: the node the edge leads to has no children
+
+Edge 0 is a sentinel pointing at the root's edge list, so a lexicon node is simply the index of the
+edge that led to it and the root is node 0. Lookups never copy the buffer - forked workers
+mapping the same file share its pages.
+"""
+
+import argparse
+import mmap
+import os
+import sys
+import zlib
+from array import array
+from typing import Iterable, Iterator
+
+from classes.Lexicon import Lexicon, TrieLexicon
+
+
+DEFAULT_DAWG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'long_wordlist.dawg')
+
+MAGIC = b'WHDAWG01'
+HEADER_SIZE = 16
+CODE_MASK = 0xFF
+LAST = 1 << 8
+TERMINAL = 1 << 9
+TARGET_SHIFT = 10
+MAX_EDGES = 1 << (32 - TARGET_SHIFT)
+
+
+def file_crc32(path: str) -> int:
+    """
+    Returns the crc32 of a file's contents - used to tell if a compiled DAWG is stale
+    """
+    with open(path, 'rb') as f:
+        return zlib.crc32(f.read())
+
+
+def compile_words(words: Iterable[str], source_crc32: int = 0) -> bytes:
+    """
+    Builds a trie from the words (3+ letters), merges identical subtrees into a DAWG
+    and returns the packed file contents
+    """
+    trie = TrieLexicon(words)
+    children = trie.children
+    terminal = trie.terminal
+
+    edges = array('I', [0]) # edge 0 is the root sentinel
+    signature_to_start: dict[tuple, int] = {}
+    node_start = [0] * len(children) # first edge index of each node's (shared) edge list
+
+    # post-order traversal - children's edge lists are placed before their parents'
+    stack = [(trie.root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if not expanded:
+            stack.append((node, True))
+            for next_node in children[node].values():
+                stack.append((next_node, False))
+            continue
+
+        if not children[node]:
+            continue # leaf - target index 0
+        signature = tuple(
+            (code, terminal[next_node], node_start[next_node])
+            for code, next_node in sorted(children[node].items())
+        )
+        start = signature_to_start.get(signature)
+        if start is None:
+            start = len(edges)
+            for i, (code, is_terminal, target) in enumerate(signature):
+                edge = code | (target << TARGET_SHIFT)
+                if is_terminal:
+                    edge |= TERMINAL
+                if i == len(signature) - 1:
+                    edge |= LAST
+                edges.append(edge)
+            signature_to_start[signature] = start
+        node_start[node] = start
+
+    if len(edges) > MAX_EDGES:
+        raise ValueError(f"Word list too large for the DAWG format: {len(edges)} edges")
+    edges[0] = node_start[trie.root] << TARGET_SHIFT
+
+    if sys.byteorder != 'little':
+        edges.byteswap()
+    header = MAGIC + len(edges).to_bytes(4, 'little') + source_crc32.to_bytes(4, 'little')
+    return header + edges.tobytes()
+
+
+def compile_file(wordlist_path: str, dawg_path: str) -> int:
+    """
+    Compiles a word list (one word per line) into a DAWG file - returns the number of edges
+    """
+    with open(wordlist_path) as f:
+        data = compile_words((line.strip() for line in f), file_crc32(wordlist_path))
+    # writing next to the target then renaming, so readers never map a half-written file
+    temp_path = dawg_path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, dawg_path)
+    return (len(data) - HEADER_SIZE) // 4
+
+
+class DawgLexicon(Lexicon):
+    """
+    Lexicon backend over a packed DAWG buffer - nodes are edge indexes, the root is 0
+    """
+    name = 'dawg'
+    root = 0
+    edges: memoryview # uint32 view over the edge section of the buffer
+    source_crc32: int # crc32 of the word list the DAWG was compiled from
+    path: str # file the buffer was mapped from - empty for in-memory buffers
+
+    def __init__(self, buffer, path: str = ''):
+        header = bytes(buffer[:HEADER_SIZE])
+        if header[:8] != MAGIC:
+            raise ValueError(f"Not a compiled DAWG file: {path or 'buffer'}")
+        edge_count = int.from_bytes(header[8:12], 'little')
+        self.source_crc32 = int.from_bytes(header[12:16], 'little')
+        self.path = path
+        self._buffer = buffer # keeps the mmap alive for as long as the lexicon is
+
+        section = memoryview(buffer)[HEADER_SIZE:HEADER_SIZE + edge_count * 4]
+        if sys.byteorder != 'little':
+            # can't read the file in place - falls back to a byteswapped copy
+            swapped = array('I', bytes(section))
+            swapped.byteswap()
+            section = memoryview(swapped).cast('B')
+        self.edges = section.cast('I')
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_DAWG_PATH) -> 'DawgLexicon':
+        """
+        Memory-maps a compiled DAWG file read-only
+        """
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, path)
+
+    def child(self, node: int, code: int) -> int | None:
+        edges = self.edges
+        i = edges[node] >> TARGET_SHIFT
+        if i == 0:
+            return None
+        while True:
+            edge = edges[i]
+            edge_code = edge & CODE_MASK
+            if edge_code == code:
+                return i
+            # lists are sorted - no point scanning past the code
+            if edge_code > code or edge & LAST:
+                return None
+            i += 1
+
+    def is_word(self, node: int) -> bool:
+        return bool(self.edges[node] & TERMINAL)
+
+    def max_suffix(self, node: int) -> int:
+        suffixes = self.__dict__.setdefault('_suffixes', {})
+        edges = self.edges
+        first = edges[node] >> TARGET_SHIFT
+        suffix = suffixes.get(first)
+        if suffix is None:
+            # memoized by edge list - lists are shared by every node with the same suffixes
+            suffix = 0
+            i = first
+            while i:
+                suffix = max(suffix, self.max_suffix(i) + 1)
+                i = 0 if edges[i] & LAST else i + 1
+            suffixes[first] = suffix
+        return suffix
+
+    def words(self) -> Iterator[str]:
+        edges = self.edges
+        stack = [(self.root, '')]
+        while stack:
+            node, prefix = stack.pop()
+            if node and edges[node] & TERMINAL:
+                yield prefix
+            i = edges[node] >> TARGET_SHIFT
+            while i:
+                edge = edges[i]
+                stack.append((i, prefix + chr(edge & CODE_MASK)))
+                i = 0 if edge & LAST else i + 1
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.words())
+
+
+def main(argv: list[str] | None = None) -> None:
+    from classes.Dictionary import DEFAULT_WORDLIST_PATH
+
+    parser = argparse.ArgumentParser(prog='python -m classes.Dawg', description="Compile word lists into memory-mapped DAWG files")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help="compile a word list (one word per line)")
+    build_parser.add_argument('wordlist', nargs='?', default=DEFAULT_WORDLIST_PATH)
+    build_parser.add_argument('-o', '--output', default=DEFAULT_DAWG_PATH)
+
+    info_parser = subparsers.add_parser('info', help="describe a compiled DAWG file")
+    info_parser.add_argument('dawg', nargs='?', default=DEFAULT_DAWG_PATH)
+
+    args = parser.parse_args(argv)
+    if args.command == 'build':
+        edge_count = compile_file(args.wordlist, args.output)
+        print(f"{args.output}: {edge_count} edges, {os.path.getsize(args.output)} bytes")
+    else:
+        lexicon = DawgLexicon.load(args.dawg)
+        print(f"{args.dawg}: {len(lexicon.edges)} edges, {len(lexicon)} words, source crc32 {lexicon.source_crc32:08x}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+Contains the dictionary data shared by every game and search:
+
+- Dictionary: immutable prefix/word hash structures built from a word list
+- get_dictionary(): returns the process-wide Dictionary, building it on first use
+
+Notes:
+Building the hash structures means reading and hashing every line of the word list,
+so it is done at most once per process (per word list path). Game and Search objects
+hold a reference to the shared Dictionary rather than building their own.
+
+get_dictionary() is thread-safe - concurrent first calls block on a lock and only one
+of them reads the file.
+
+The word list ships inside the classes package, and DEFAULT_WORDLIST_PATH points at it through the
+package's own location - the solver works from any working directory.
+"""
+
+import os
+from collections import defaultdict
+from threading import Lock
+from types import MappingProxyType
+from typing import Iterator, Mapping
+
+
+PACKAGE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_WORDLIST_PATH = os.path.join(PACKAGE_DIRECTORY, 'long_wordlist.txt')
+
+
+class Dictionary():
+    """
+    Immutable hash structures used to look up prefixes and words
+
+    hashset: {'a', 'ba', 'tor', ...}
+    hashmap: {'tor': frozenset({'torn', 'torch', ...}), 'tra': frozenset({'train', 'trade', ...}) ...}
+    """
+    prefixes: frozenset[str] # all possible prefixes 1-3 letters in english dictionary
+    prefixes_to_words: Mapping[str, frozenset[str]] # all 3 letter prefixes associated with a set of their words
+    words: frozenset[str] # every word with 3+ letters
+    path: str # word list the structures were built from
+
+    __slots__ = ('prefixes', 'prefixes_to_words', 'words', 'path')
+
+    def __init__(self, words, path: str = ''):
+        """
+        Creates a hashset and a hashmap from an iterable of words:
+            - hashset contains all possible 1, 2, and 3 letter prefixes.
+            - hashmap associates every possible 3 letter prefix with a set of its words
+
+        'pre' is the 3-letter prefix with the largest number of words: 225
+        """
+        prefixes = set()
+        prefixes_to_words = defaultdict(set)
+
+        for word in words:
+            # game only accepts 3 letter words
+            if len(word) >= 3:
+                prefixes.add(word[0])
+                prefixes.add(word[:2])
+                prefixes.add(word[:3])
+                # adding all words to dictionary
+                prefixes_to_words[word[:3]].add(word)
+
+        object.__setattr__(self, 'prefixes', frozenset(prefixes))
+        object.__setattr__(self, 'prefixes_to_words', MappingProxyType(
+            {prefix: frozenset(prefix_words) for prefix, prefix_words in prefixes_to_words.items()}
+        ))
+        object.__setattr__(self, 'words', frozenset().union(*self.prefixes_to_words.values()))
+        object.__setattr__(self, 'path', path)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Dictionary objects are immutable")
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.words
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def words_with_prefix(self, prefix: str) -> frozenset[str]:
+        """
+        Returns all words starting with a 3 letter prefix - empty if there are none
+        """
+        return self.prefixes_to_words.get(prefix, frozenset())
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_WORDLIST_PATH) -> 'Dictionary':
+        """
+        Reads a word list with one word per line
+        """
+        return cls(read_words(path), path=path)
+
+
+def read_words(path: str = DEFAULT_WORDLIST_PATH) -> Iterator[str]:
+    """
+    Yields every line of a word list, stripped - for backends that don't need the prefix hash structures
+    """
+    with open(path) as f:
+        for line in f:
+            yield line.strip()
+
+
+_dictionaries: dict[str, Dictionary] = {}
+_dictionaries_lock = Lock()
+
+
+def get_dictionary(path: str = DEFAULT_WORDLIST_PATH) -> Dictionary:
+    """
+    Returns the shared Dictionary for a word list, building it on the first call
+
+    Double-checked locking - after the first build, lookups never touch the lock
+    """
+    dictionary = _dictionaries.get(path)
+    if dictionary is None:
+        with _dictionaries_lock:
+            dictionary = _dictionaries.get(path)
+            if dictionary is None:
+                dictionary = Dictionary.from_file(path)
+                _dictionaries[path] = dictionary
+    return dictionary
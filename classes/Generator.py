@@ -0,0 +1,199 @@
+"""
+Contains the random board generator:
+
+- ENGLISH_FREQUENCIES / BOGGLE_DICE: the letter sources boards are drawn from
+- TargetCheck: follows a board's words as they're found and tells when the targets are met
+- BoardGenerator: draws boards letter by letter or die by die, optionally only ones with enough words
+
+Notes:
+Letters come from one of LETTER_SOURCES:
+- english: each cell drawn by English letter frequency
+- dice: the 16 Boggle dice (Word Hunt's aren't published) rolled and shuffled - 'qu' is one tile -
+  bigger boards use as many sets as they need
+- uniform: each cell drawn uniformly from a-z (the old Randomize button)
+
+A board with targets is first checked for a min_longest letter word with Search.iter_long_words(),
+which skips every branch too short to get there, then solved with the regular DFS only until both
+targets are met - a good board usually costs a fraction of a full solve, a board that falls short
+costs about one. Boards that fall short are thrown away, unless max_repairs is set: the cells no word
+found so far goes through are then redrawn (or their die rerolled) - every word found stays valid,
+since none of them uses a redrawn cell - and only the paths through the redrawn cells are searched
+(Search.iter_paths_through). Repairs need fewer fresh draws, but a repair round costs about as much
+as checking a fresh board, so they don't make generation faster.
+"""
+
+import random
+from itertools import accumulate
+from typing import Iterable, Iterator
+
+from classes.Lexicon import DEFAULT_LEXICON, Lexicon, get_lexicon
+from classes.Nodes import FoundWord, Search
+
+
+# relative frequency of each letter in English text (percent)
+ENGLISH_FREQUENCIES = {
+    'a': 8.2, 'b': 1.5, 'c': 2.8, 'd': 4.3, 'e': 12.7, 'f': 2.2, 'g': 2.0, 'h': 6.1, 'i': 7.0,
+    'j': 0.15, 'k': 0.77, 'l': 4.0, 'm': 2.4, 'n': 6.7, 'o': 7.5, 'p': 1.9, 'q': 0.095, 'r': 6.0,
+    's': 6.3, 't': 9.1, 'u': 2.8, 'v': 0.98, 'w': 2.4, 'x': 0.15, 'y': 2.0, 'z': 0.074,
+}
+BOGGLE_DICE = (
+    'aaeegn', 'abbjoo', 'achops', 'affkps', 'aoottw', 'cimotu', 'deilrx', 'delrvy',
+    'distty', 'eeghnw', 'eeinsu', 'ehrtvw', 'eiosst', 'elrtty', 'himnqu', 'hlnnrz',
+)
+LETTER_SOURCES = ('english', 'dice', 'uniform')
+DEFAULT_LETTER_SOURCE = 'english'
+
+ALPHABET = tuple(ENGLISH_FREQUENCIES)
+ENGLISH_CUMULATIVE_WEIGHTS = tuple(accumulate(ENGLISH_FREQUENCIES.values()))
+
+
+def die_faces(die: str) -> tuple[str, ...]:
+    """
+    Returns a die's faces - a 'q' face is the 'qu' tile
+    """
+    return tuple('qu' if face == 'q' else face for face in die)
+
+
+class TargetCheck():
+    """
+    Follows the words found on a board until it has min_words distinct words and one of min_longest+ letters
+    """
+    min_words: int # distinct words the board needs
+    min_longest: int # letters the board's longest word needs
+    words: set[str] # distinct words found so far
+    longest: int # letters in the longest word found so far
+    used_cells: int # bitmask of the cells some path found so far goes through
+
+    def __init__(self, min_words: int = 0, min_longest: int = 0):
+        self.min_words = min_words
+        self.min_longest = min_longest
+        self.words = set()
+        self.longest = 0
+        self.used_cells = 0
+
+    def met(self) -> bool:
+        return len(self.words) >= self.min_words and self.longest >= self.min_longest
+
+    def add(self, found_words: Iterable[FoundWord]) -> bool:
+        """
+        Takes words until the targets are met - returns whether they are
+        """
+        if self.met():
+            return True
+        for found_word in found_words:
+            self.words.add(found_word.word)
+            self.longest = max(self.longest, len(found_word.word))
+            for index in found_word.path:
+                self.used_cells |= 1 << index
+            if self.met():
+                return True
+        return False
+
+
+class BoardGenerator():
+    """
+    Draws random boards (lists of columns, like Game.find_words takes) from one of LETTER_SOURCES
+
+    min_words / min_longest: only return boards with at least this many distinct words / a word this long
+    max_repairs: rounds of redrawing unused cells before a board that falls short is thrown away (none by default)
+    seed: makes the boards reproducible - a random.Random is drawn from as is
+    """
+    letters: str # one of LETTER_SOURCES
+    min_words: int # distinct words every board needs
+    min_longest: int # letters every board's longest word needs
+    max_repairs: int # repair rounds per drawn board
+    rng: random.Random # source of every draw
+    draws: int # boards drawn from scratch
+    repairs: int # repair rounds run
+
+    def __init__(self, letters: str = DEFAULT_LETTER_SOURCE, min_words: int = 0, min_longest: int = 0,
+                 max_repairs: int = 0, lexicon: str | Lexicon = DEFAULT_LEXICON,
+                 seed: int | str | random.Random | None = None):
+        if letters not in LETTER_SOURCES:
+            raise ValueError(f"Unknown letter source {letters!r} - expected one of {', '.join(LETTER_SOURCES)}")
+        self.letters = letters
+        self.min_words = min_words
+        self.min_longest = min_longest
+        self.max_repairs = max_repairs
+        # looked up by the first board checked against the targets - draw() never needs it
+        self._lexicon = lexicon
+        self.rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+        self.draws = self.repairs = 0
+
+    @property
+    def lexicon(self) -> Lexicon:
+        """
+        Shared lexicon engine the targets are checked against - a backend name is only looked up when first needed
+        """
+        if isinstance(self._lexicon, str):
+            self._lexicon = get_lexicon(self._lexicon)
+        return self._lexicon
+
+    def dice(self, cell_count: int) -> list[tuple[str, ...]]:
+        """
+        Returns the faces each cell is drawn from - the same 26 letters for every cell unless rolling dice
+        """
+        if self.letters != 'dice':
+            return [ALPHABET] * cell_count
+        dice = []
+        while len(dice) < cell_count:
+            dice_set = list(BOGGLE_DICE)
+            self.rng.shuffle(dice_set)
+            dice.extend(die_faces(die) for die in dice_set)
+        return dice[:cell_count]
+
+    def roll(self, faces: tuple[str, ...]) -> str:
+        if self.letters == 'english':
+            return self.rng.choices(faces, cum_weights=ENGLISH_CUMULATIVE_WEIGHTS)[0]
+        return self.rng.choice(faces)
+
+    def draw(self, width: int, height: int) -> list[list[str]]:
+        """
+        Returns a random width x height board, ignoring the targets
+        """
+        cells = [self.roll(faces) for faces in self.dice(width * height)]
+        return [cells[x * height:(x + 1) * height] for x in range(width)]
+
+    def generate(self, width: int, height: int, max_draws: int = 1000) -> list[list[str]]:
+        """
+        Returns a random width x height board meeting the targets - raises ValueError if none turns up in max_draws boards
+        """
+        for _ in range(max_draws):
+            self.draws += 1
+            dice = self.dice(width * height)
+            cells = [self.roll(faces) for faces in dice]
+            check = TargetCheck(self.min_words, self.min_longest)
+            search = Search([cells[x * height:(x + 1) * height] for x in range(width)], self.lexicon)
+            # only walks branches that can still get long enough - rejects boards without a long word cheaply
+            if self.min_longest:
+                long_word = next(search.iter_long_words(self.min_longest), None)
+                if long_word is None:
+                    continue
+                check.add([long_word])
+            met = check.add(search.iter_words())
+
+            for _ in range(self.max_repairs):
+                unused_cells = [index for index in range(len(cells)) if not check.used_cells >> index & 1]
+                if met or not unused_cells:
+                    break
+                self.repairs += 1
+                redrawn = 0
+                for index in unused_cells:
+                    cells[index] = self.roll(dice[index])
+                    redrawn |= 1 << index
+                search = Search([cells[x * height:(x + 1) * height] for x in range(width)], self.lexicon)
+                met = check.add(search.iter_paths_through(redrawn))
+
+            if met:
+                return [cells[x * height:(x + 1) * height] for x in range(width)]
+        raise ValueError(f"No {width}x{height} board with {self.min_words} words and a {self.min_longest} letter word "
+                         f"in {max_draws} draws")
+
+    def boards(self, width: int, height: int, count: int | None = None) -> Iterator[list[list[str]]]:
+        """
+        Yields count boards meeting the targets - forever if count is None
+        """
+        generated = 0
+        while count is None or generated < count:
+            yield self.generate(width, height)
+            generated += 1
@@ -0,0 +1,179 @@
+"""
+Contains the bounded search history kept by every Game:
+
+- SearchHistory: the most recent SearchResults in memory, older ones optionally spilled to disk,
+  with aggregate statistics kept up to date as results are added
+- summary(): the compact, JSON serializable record a spilled SearchResults is reduced to
+
+Notes:
+SearchHistory behaves like a list of the results still in memory - indexing, slicing ([-100:]),
+iteration and len() all see the last maxsize results only. Aggregates (searches, search time,
+words found, longest/best word, points) cover every result ever added, spilled or not.
+
+A spill path ending in .jsonl gets one JSON record per line; any other path is a SQLite database
+with a history table. The file is only opened by the first spill - a history that never spills never
+touches it - and stays open until close() (or the end of a with block). Spilled records are read back
+with spilled().
+"""
+
+import json
+import os
+from collections import deque
+from typing import Iterator
+
+from classes.Nodes import EMPTY_WORD, FoundWord, SearchResults
+
+
+DEFAULT_HISTORY_SIZE = 1000
+
+
+def summary(results: SearchResults) -> dict:
+    """
+    Reduces a SearchResults to a compact record - words and headline numbers, no paths
+    """
+    return {
+        'words': sorted(results.words_by_character),
+        'path_count': len(results.words_found),
+        'longest_word': results.longest_word.word,
+        'longest_path': results.coordinates(results.longest_word.path),
+        'score': results.score,
+        'search_time': results.search_time,
+    }
+
+
+class SearchHistory():
+    """
+    The last maxsize SearchResults of a game plus running totals over all of them
+
+    maxsize: results kept in memory - None keeps everything (the old unbounded behavior)
+    path: optional JSONL/SQLite file older results are spilled to instead of being dropped
+    """
+    maxsize: int | None # most results kept in memory
+    path: str | None # spill file - None drops results that fall out of memory
+    results: deque[SearchResults] # results still in memory - oldest first
+    searches: int # results ever added
+    spilled_count: int # results written to the spill file
+    total_search_time: float # sum of every result's search_time
+    total_words_found: int # sum of every result's distinct word count
+    total_score: int # sum of every result's points
+    longest_word: FoundWord # longest word across every result
+    best_word: FoundWord # highest scoring word across every result
+    best_score: int # points of best_word
+
+    def __init__(self, maxsize: int | None = DEFAULT_HISTORY_SIZE, path: str | None = None):
+        self.maxsize = maxsize
+        self.path = path
+        self.results = deque()
+        self.searches = self.spilled_count = self.total_words_found = self.total_score = self.best_score = 0
+        self.total_search_time = 0.0
+        self.longest_word = self.best_word = EMPTY_WORD
+        self._file = None
+        self._connection = None
+
+    def _open(self, path: str) -> None:
+        if path.endswith('.jsonl'):
+            self._file = open(path, 'a')
+        else:
+            import sqlite3
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute("CREATE TABLE IF NOT EXISTS history (id INTEGER PRIMARY KEY, record TEXT NOT NULL)")
+            self._connection.commit()
+
+    def append(self, results: SearchResults) -> None:
+        """
+        Adds a search's results, spilling (or dropping) the oldest one in memory past maxsize
+        """
+        self.searches += 1
+        self.total_search_time += results.search_time
+        self.total_words_found += len(results.words_by_character)
+        self.total_score += results.score
+        if len(results.longest_word.word) > len(self.longest_word.word):
+            self.longest_word = results.longest_word
+        best_score = results.scoring.score(results.best_word.word) if results.best_word is not EMPTY_WORD else 0
+        if best_score > self.best_score:
+            self.best_word, self.best_score = results.best_word, best_score
+
+        self.results.append(results)
+        if self.maxsize is not None:
+            while len(self.results) > self.maxsize:
+                self.spill(self.results.popleft())
+
+    def spill(self, results: SearchResults) -> None:
+        """
+        Writes a result leaving memory to the spill file, if there is one - opening it on the first spill
+        """
+        if self.path is None:
+            return
+        if self._file is None and self._connection is None:
+            self._open(self.path)
+        if self._file is not None:
+            self._file.write(json.dumps(summary(results)) + '\n')
+            self._file.flush()
+        else:
+            self._connection.execute("INSERT INTO history (record) VALUES (?)", (json.dumps(summary(results)),))
+            self._connection.commit()
+        self.spilled_count += 1
+
+    def spilled(self) -> Iterator[dict]:
+        """
+        Yields the records in the spill file, oldest first - including ones spilled by earlier processes
+        """
+        if self.path is None or not os.path.exists(self.path):
+            return
+        if not self.path.endswith('.jsonl'):
+            import sqlite3
+            connection = self._connection or sqlite3.connect(self.path)
+            try:
+                records = connection.execute("SELECT record FROM history ORDER BY id").fetchall()
+            finally:
+                if connection is not self._connection:
+                    connection.close()
+            for (record,) in records:
+                yield json.loads(record)
+            return
+        with open(self.path) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def averages(self) -> dict[str, float]:
+        """
+        Per-search means over every result ever added
+        """
+        searches = self.searches or 1
+        return {
+            'search_time': self.total_search_time / searches,
+            'words_found': self.total_words_found / searches,
+            'score': self.total_score / searches,
+        }
+
+    def close(self) -> None:
+        """
+        Closes the spill file - a later spill opens it again
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> 'SearchHistory':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[SearchResults]:
+        return iter(self.results)
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            return list(self.results)[index]
+        return self.results[index]
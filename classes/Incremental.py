@@ -0,0 +1,91 @@
+"""
+Contains the incremental re-solve for boards that change a few cells at a time:
+
+- SolveDiff: words gained and lost since the previous board, and the cells that changed
+- IncrementalSolver: remembers the last board and every path found on it, re-searching only what a change can affect
+
+Notes:
+A path that avoids every changed cell spells the same word on the new board, so it's kept as is.
+Paths through a changed cell are dropped, and the only new paths are ones through a changed cell -
+Search.iter_paths_through() finds those, cutting branches that can't reach a changed cell within
+max_length. A board of a different shape (or the first board) gets a full solve.
+
+Results hold every path, like a fresh find_words(), but words_found may be in a different order.
+"""
+
+from typing import NamedTuple
+
+from classes.Board import Board
+from classes.Lexicon import DEFAULT_LEXICON, Lexicon, get_lexicon
+from classes.Nodes import FoundWord, Search, SearchResults
+
+
+class SolveDiff(NamedTuple):
+    """
+    Words gained and lost since the previous board (alphabetical), plus the flat indices of the changed cells
+    """
+    added: list[str]
+    removed: list[str]
+    changed_cells: tuple[int, ...]
+
+
+class IncrementalSolver():
+    """
+    Solves a sequence of boards, reusing the previous board's paths wherever a change can't affect them
+    """
+    lexicon: Lexicon # shared lexicon engine
+    board: Board | None # the last board solved
+    max_length: int | None # word length cap the last board was solved with
+    words_found: list[FoundWord] # every path found on the last board
+
+    def __init__(self, lexicon: str | Lexicon = DEFAULT_LEXICON):
+        self.lexicon = get_lexicon(lexicon) if isinstance(lexicon, str) else lexicon
+        self.board = None
+        self.max_length = None
+        self.words_found = []
+
+    def changed_cells(self, board: Board) -> tuple[int, ...] | None:
+        """
+        Returns the flat indices of the cells that differ from the last board - None if it can't be compared
+        """
+        previous = self.board
+        if previous is None or (previous.width, previous.height) != (board.width, board.height):
+            return None
+        if not previous.tiles and not board.tiles:
+            return tuple(index for index, (old, new) in enumerate(zip(previous.cells, board.cells)) if old != new)
+        return tuple(index for index in range(len(board)) if previous.character(index) != board.character(index))
+
+    def solve(self, character_2d_array: list[list[str]], max_length: int | None = None) -> tuple[SearchResults, SolveDiff]:
+        """
+        Solves a board - incrementally if it has the last board's shape and length cap
+
+        Returns the full results (every path) and the diff against the last board
+        """
+        search = Search(character_2d_array, self.lexicon, max_length)
+        changed = self.changed_cells(search.board) if max_length == self.max_length else None
+        old_words = {found_word.word for found_word in self.words_found}
+
+        if changed is None:
+            found_words = list(search.iter_words())
+            changed = tuple(range(len(search.board)))
+        else:
+            changed_mask = 0
+            for index in changed:
+                changed_mask |= 1 << index
+            found_words = [
+                found_word for found_word in self.words_found
+                if not any(changed_mask >> index & 1 for index in found_word.path)
+            ]
+            if changed_mask:
+                found_words.extend(search.iter_paths_through(changed_mask))
+
+        results = SearchResults(search.board.height)
+        for found_word in found_words:
+            results.add_word(found_word)
+        results.finish()
+
+        self.board = search.board
+        self.max_length = max_length
+        self.words_found = found_words
+        new_words = set(results.words_by_character)
+        return results, SolveDiff(sorted(new_words - old_words), sorted(old_words - new_words), changed)
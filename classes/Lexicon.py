@@ -0,0 +1,241 @@
+"""
+Contains the lexicon engines the solvers walk alongside the grid:
+
+- Lexicon: interface - nodes are opaque, stepped through one character code at a time
+- TrieLexicon: compact prefix trie - prefix test and word test are O(1) per letter
+- HashLexicon: the original prefix hashset/hashmap backend, kept for A/B benchmarking
+- DawgLexicon (see Dawg.py): packed DAWG read from a memory-mapped, precompiled file
+- get_lexicon(): returns the process-wide lexicon for a backend name, building it on first use
+
+Notes:
+Character codes are ints (ord values / bytes items) so boards can be stored as flat buffers.
+child() returns None when no dictionary word starts with the extended prefix - that's the
+solver's signal to prune the branch. is_word() only reports words with 3+ letters.
+
+The default 'auto' backend uses the compiled DAWG when one exists for the current word list
+and falls back to building a trie from the text file otherwise.
+"""
+
+import os
+import zlib
+from threading import RLock
+from typing import Any, Iterable, Iterator
+
+from classes.Dictionary import Dictionary, get_dictionary, read_words
+
+
+class Lexicon():
+    """
+    Interface shared by every lexicon backend
+
+    A node represents a prefix of at least one dictionary word
+    """
+    name: str = ''
+    root: Any # node for the empty prefix
+
+    def child(self, node, code: int):
+        """
+        Returns the node reached by appending the character code to the node's prefix,
+        or None if no word starts with that prefix
+        """
+        raise NotImplementedError
+
+    def is_word(self, node) -> bool:
+        """
+        Returns True if the node's prefix is a complete word (3+ letters)
+        """
+        raise NotImplementedError
+
+    def words(self) -> Iterator[str]:
+        """
+        Yields every word in the lexicon
+        """
+        raise NotImplementedError
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        crc32 of the sorted word list - identifies the words a lexicon holds, whatever its backend
+        """
+        fingerprint = self.__dict__.get('_fingerprint')
+        if fingerprint is None:
+            words = '\n'.join(sorted(self.words()))
+            fingerprint = f"{zlib.crc32(words.encode()):08x}"
+            self.__dict__['_fingerprint'] = fingerprint
+        return fingerprint
+
+    def max_suffix(self, node) -> int | None:
+        """
+        Returns how many letters the longest word extending the node's prefix adds to it -
+        None if the backend can't tell
+        """
+        return None
+
+    def find(self, word: str):
+        """
+        Walks the lexicon along a whole string - None if it isn't a prefix of any word
+        """
+        node = self.root
+        for character in word:
+            node = self.child(node, ord(character))
+            if node is None:
+                return None
+        return node
+
+    def __contains__(self, word: str) -> bool:
+        node = self.find(word)
+        return node is not None and self.is_word(node)
+
+
+class TrieLexicon(Lexicon):
+    """
+    Prefix trie stored as parallel arrays - node n's children are children[n] and
+    terminal[n] is 1 if the path to n spells a word
+
+    {0: {ord('c'): 1}, 1: {ord('a'): 2}, 2: {ord('t'): 3}, 3: {}} -> terminal[3] == 1
+    """
+    name = 'trie'
+    root = 0
+    children: list[dict[int, int]] # child nodes for each node keyed by character code
+    terminal: bytearray # 1 if the node ends a word
+
+    def __init__(self, words: Iterable[str]):
+        children: list[dict[int, int]] = [{}]
+        terminal = bytearray(1)
+
+        for word in words:
+            # game only accepts 3 letter words
+            if len(word) < 3:
+                continue
+            node = 0
+            for character in word:
+                code = ord(character)
+                next_node = children[node].get(code)
+                if next_node is None:
+                    next_node = len(children)
+                    children[node][code] = next_node
+                    children.append({})
+                    terminal.append(0)
+                node = next_node
+            terminal[node] = 1
+
+        self.children = children
+        self.terminal = terminal
+
+    def child(self, node: int, code: int) -> int | None:
+        return self.children[node].get(code)
+
+    def is_word(self, node: int) -> bool:
+        return self.terminal[node] == 1
+
+    def max_suffix(self, node: int) -> int:
+        suffixes = self.__dict__.get('_suffixes')
+        if suffixes is None:
+            # children always come after their parent, so one backwards pass sees every child first
+            suffixes = [0] * len(self.children)
+            for parent in range(len(self.children) - 1, -1, -1):
+                for next_node in self.children[parent].values():
+                    if suffixes[next_node] >= suffixes[parent]:
+                        suffixes[parent] = suffixes[next_node] + 1
+            self.__dict__['_suffixes'] = suffixes
+        return suffixes[node]
+
+    def words(self) -> Iterator[str]:
+        stack = [(self.root, '')]
+        while stack:
+            node, prefix = stack.pop()
+            if self.terminal[node]:
+                yield prefix
+            for code, next_node in self.children[node].items():
+                stack.append((next_node, prefix + chr(code)))
+
+    def __len__(self) -> int:
+        return sum(self.terminal)
+
+
+class HashLexicon(Lexicon):
+    """
+    Original prefix hashset/hashmap lookups wrapped in the Lexicon interface
+
+    Nodes are the prefix strings themselves. Prefixes of 1-3 letters are checked against the
+    prefix hashset, longer ones by scanning every word sharing their first 3 letters.
+    """
+    name = 'hash'
+    root = ''
+    dictionary: Dictionary
+
+    def __init__(self, dictionary: Dictionary):
+        self.dictionary = dictionary
+
+    def child(self, node: str, code: int) -> str | None:
+        prefix = node + chr(code)
+        if len(prefix) <= 3:
+            return prefix if prefix in self.dictionary.prefixes else None
+        # prefix containing 4+ characters - possible words must start with it
+        for word in self.dictionary.words_with_prefix(prefix[:3]):
+            if word[:len(prefix)] == prefix:
+                return prefix
+        return None
+
+    def is_word(self, node: str) -> bool:
+        return node in self.dictionary.words_with_prefix(node[:3])
+
+    def words(self) -> Iterator[str]:
+        return iter(self.dictionary.words)
+
+    def __len__(self) -> int:
+        return len(self.dictionary)
+
+
+LEXICON_BACKENDS = ('auto', 'trie', 'hash', 'dawg')
+DEFAULT_LEXICON = 'auto'
+
+_lexicons: dict[str, Lexicon] = {}
+_lexicons_lock = RLock() # reentrant - 'auto' resolves to another backend while holding it
+
+
+def compiled_dawg_path() -> str | None:
+    """
+    Returns the path of the compiled DAWG if it exists and was built from the current word list
+    """
+    from classes.Dawg import DEFAULT_DAWG_PATH, HEADER_SIZE, MAGIC, file_crc32
+    from classes.Dictionary import DEFAULT_WORDLIST_PATH
+
+    if not os.path.exists(DEFAULT_DAWG_PATH):
+        return None
+    with open(DEFAULT_DAWG_PATH, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+    if header[:8] != MAGIC or int.from_bytes(header[12:16], 'little') != file_crc32(DEFAULT_WORDLIST_PATH):
+        return None # stale or foreign artifact
+    return DEFAULT_DAWG_PATH
+
+
+def build_lexicon(name: str) -> Lexicon:
+    """
+    Builds a new lexicon for a backend name - from the compiled DAWG or the shared Dictionary
+    """
+    if name == 'auto':
+        return get_lexicon('dawg' if compiled_dawg_path() else 'trie')
+    if name == 'dawg':
+        from classes.Dawg import DEFAULT_DAWG_PATH, DawgLexicon
+        return DawgLexicon.load(DEFAULT_DAWG_PATH)
+    if name == 'trie':
+        # straight from the file - the Dictionary's prefix structures would only be thrown away
+        return TrieLexicon(read_words())
+    if name == 'hash':
+        return HashLexicon(get_dictionary())
+    raise ValueError(f"Unknown lexicon backend '{name}' - expected one of {LEXICON_BACKENDS}")
+
+
+def get_lexicon(name: str = DEFAULT_LEXICON) -> Lexicon:
+    """
+    Returns the shared lexicon for a backend name, building it on the first call
+    """
+    lexicon = _lexicons.get(name)
+    if lexicon is None:
+        with _lexicons_lock:
+            lexicon = _lexicons.get(name)
+            if lexicon is None:
+                lexicon = build_lexicon(name)
+                _lexicons[name] = lexicon
+    return lexicon
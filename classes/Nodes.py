@@ -2,37 +2,77 @@
 Contains classes related to the word search such as:
 
 - Letter: nodes for each cell in the game grid
-- SearchResults: resultant data from a search in the game like words found
-- Game: holds a list of SearchResult objects for each search and dictionary/prefix data
-- Search(Game): conducts a search and finds all words in the grid by off word hunt's rules
+- FoundWord: a word found in the grid plus the flat cell indices traversed to spell it
+- SearchResults: resultant data from a search in the game like words found and points scored
+- Game: holds the history of SearchResults from its searches and a reference to the shared dictionary
+- Search: conducts a search and finds all words in the grid by off word hunt's rules
 
 Notes:
 The Game class holds a find_words() method to be called with a 2d array of characters
 (inner lists are columns - x coordinate is the first index / y coordinate is the second index).
 
 Method is to be called whenever the user begins a search - resulting SearchResults 
-is appended to the Game object's all_search_results attribute (list[SearchResults])
+is appended to the Game object's all_search_results attribute (a bounded SearchHistory - see History.py)
+
+Dictionary/prefix data lives in a single Dictionary object per process (see Dictionary.py) -
+Game and Search only hold a reference to it, so solving many boards never reloads the word list.
+The solver walks a Lexicon (see Lexicon.py) alongside the grid - a compiled DAWG or trie by default,
+with the original prefix hashset/hashmap lookups available as the 'hash' backend.
+
+Cells are identified by flat indices: index = x * height + y, where height is the number of
+letters in each column - the same order as Search.letters_1d. Found words store tuples of these
+indices rather than copies of Letter objects (which would drag the whole neighbor graph along).
 """
 
-from collections import defaultdict
-from copy import deepcopy
-from time import time
+from time import perf_counter, time
+from heapq import heappop, heappush, nlargest
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, NamedTuple
+
+from classes.Board import TILE_BASE, Board
+from classes.Dictionary import Dictionary, get_dictionary
+from classes.Lexicon import DEFAULT_LEXICON, Lexicon, get_lexicon
+from classes.Scoring import DEFAULT_SCORING, ScoringModel
+from classes.Stats import InstrumentedLexicon, SearchStats, phase
+
+if TYPE_CHECKING:
+    from classes.Cache import ResultCache
+    from classes.History import SearchHistory
+    from classes.Incremental import IncrementalSolver, SolveDiff
 
 
 class Letter():
     """
-    Represents a letter in the game's grid
+    Represents a letter in the game's grid - a view over one cell of a Board
     """
-    character: str # a-z
+    character: str # a-z - or a multi-letter tile such as "qu"
     neighbors: list['Letter'] # all touching Letter objects
     coordinates: tuple[int, int] # (x, y) - (0, 0) at top left, all coordinates are positive
-    currently_found: bool # for recursion branches - can't make a word using same character twice
+    index: int # flat cell index - x * height + y
 
-    def __init__(self, character: str, coordinates: tuple[int, int]):
+    def __init__(self, character: str, coordinates: tuple[int, int], index: int = 0):
         self.character = character
         self.coordinates = coordinates
+        self.index = index
         self.neighbors = []
-        self.currently_found = False
+
+
+class FoundWord(NamedTuple):
+    """
+    A word found in the grid and the path of flat cell indices used to spell it
+    """
+    word: str
+    path: tuple[int, ...]
+
+
+EMPTY_WORD = FoundWord('', ())
+
+
+def path_coordinates(path: tuple[int, ...], height: int) -> list[tuple[int, int]]:
+    """
+    Converts a path of flat cell indices into (x, y) coordinates
+    """
+    return [divmod(index, height) for index in path]
 
 
 class SearchResults():
@@ -40,278 +80,687 @@ class SearchResults():
     Holds all relevant data related to a game search
 
     NOTE: words_by_character likely includes less items than words_by_coordinates and words_found -
-    can be multiple branches for spelling the same word
+    can be multiple branches for spelling the same word (unless unique_words is set, which keeps
+    only the first path found for each word)
     """
-    words_found: list[list[Letter]] # each inner list holds the subsequent Letter objects traversed needed to make a word
-    longest_word: list[Letter] # the longest word that's been found
+    words_found: list[FoundWord] # each word with the subsequent cell indices traversed needed to make it
+    longest_word: FoundWord # the longest word that's been found
+    best_word: FoundWord # the highest scoring word that's been found
+    score: int # points for every distinct word found
+    scoring: ScoringModel # points per word - Word Hunt's length table by default (see Scoring.py)
     words_by_character: set[str] | list[str] # all words found in a search
-    words_by_coordinates: list[list[tuple[int, int]]] # each inner list holds subsequent coordinates of letters that make up a word
     search_time: float # runtime for finding words
+    height: int # letters per column of the searched grid - for converting paths to coordinates
+    unique_words: bool # keep only one path per distinct word
+    paths_seen: set[tuple[int, ...]] # every path added so far - for deduplication, emptied by finish()
+    stats: SearchStats | None # node counts and phase timings - only kept when requested (see Stats.py)
 
-    def __init__(self):
+    def __init__(self, height: int = 0, unique_words: bool = False, stats: SearchStats | None = None,
+                 scoring: ScoringModel = DEFAULT_SCORING):
         self.words_found = []
-        self.longest_word = []
+        self.longest_word = EMPTY_WORD
+        self.best_word = EMPTY_WORD
+        self.score = 0
+        self.scoring = scoring
         self.words_by_character = set()
-        self.words_by_coordinates = []
         self.search_time = time()
-    
-    def eliminate_duplicates(self) -> None:
+        self.height = height
+        self.unique_words = unique_words
+        self.paths_seen = set()
+        self.stats = stats
+
+    def coordinates(self, path: tuple[int, ...]) -> list[tuple[int, int]]:
+        """
+        Converts a path of flat cell indices from this search into (x, y) coordinates
         """
-        Removes any deepcopied duplicates from inner Letter lists in words_found
-        Much easier to do this than tinker with the recursive function - a little less efficient,
-        but not by much
+        return path_coordinates(path, self.height)
 
-        Redefines the words_found attribute.
+    @property
+    def words_by_coordinates(self) -> list[list[tuple[int, int]]]:
         """
-        words_without_duplicates = []
-        coordinate_traverals = []
+        Each found word's path as (x, y) coordinates, in words_found order - worked out when asked for
+        """
+        return [self.coordinates(found_word.path) for found_word in self.words_found]
 
-        for word in self.words_found:
-            coordinate_traveral = [letter.coordinates for letter in word]
-            # only adding word if current path hasn't been used - based off coordinates
-            if coordinate_traveral not in coordinate_traverals:
-                coordinate_traverals.append(coordinate_traveral)
-                words_without_duplicates.append(word)
-        
-        self.words_found = words_without_duplicates
-    
-    def find_data(self) -> None:
+    def add_word(self, found_word: FoundWord) -> bool:
         """
-        Uses the words_found attribute to find data for characters/coordinates
+        Adds a found word unless its path (or, in unique_words mode, the word itself) was already added
 
-        Fills in the words_by_character and words_by_coordinates attributes, initially
-        set as empty sets in constructor
+        Duplicates are dropped as they are produced using hashed paths, and words_by_character /
+        longest_word / score are filled in the same pass - each distinct word
+        scores once. Returns True if the word was added.
         """
-        for word in self.words_found:
-            self.words_by_coordinates.append([])
-            new_word = []
-            for letter in word:
-                self.words_by_coordinates[-1].append(letter.coordinates)
-                new_word.append(letter.character)
-            self.words_by_character.add(''.join(new_word)) # type: ignore
-    
+        new_word = found_word.word not in self.words_by_character
+        if found_word.path in self.paths_seen or (self.unique_words and not new_word):
+            if self.stats is not None:
+                self.stats.duplicates_dropped += 1
+            return False
+        self.paths_seen.add(found_word.path)
+        self.words_found.append(found_word)
+        if new_word:
+            self.words_by_character.add(found_word.word) # type: ignore
+            points = self.scoring.score(found_word.word)
+            self.score += points
+            if self.best_word is EMPTY_WORD or points > self.scoring.score(self.best_word.word):
+                self.best_word = found_word
+        # checking if its the longest word added - by letters, so a "qu" tile counts two
+        if len(found_word.word) > len(self.longest_word.word):
+            self.longest_word = found_word
+        return True
+
+    def finish(self) -> None:
+        """
+        Sorts words_by_character alphabetically and turns search_time from a start time into a runtime
+
+        The paths kept for deduplication are let go - kept results only hold words_found
+        """
+        self.words_by_character = sorted(self.words_by_character)
+        self.paths_seen = set()
+        self.search_time = round(time() - self.search_time, 2)
+
+
+def word_length(found_word: FoundWord) -> int:
+    return len(found_word.word)
+
+
+def unique(found_words: Iterator[FoundWord]) -> Iterator[FoundWord]:
+    """
+    Drops every FoundWord spelling a word that was already yielded
+    """
+    words_seen = set()
+    for found_word in found_words:
+        if found_word.word not in words_seen:
+            words_seen.add(found_word.word)
+            yield found_word
+
+
+def top_k(character_2d_array: list[list[str]], k: int, scoring: ScoringModel = DEFAULT_SCORING,
+          max_length: int | None = None) -> SearchResults:
+    """
+    Finds the k highest scoring words in a grid, using the shared default lexicon - see Game.top_k()
+    """
+    return Game(scoring=scoring).top_k(character_2d_array, k, max_length)
+
+
+def iter_words(character_2d_array: list[list[str]], longest_first: bool = False,
+               limit: int | None = None, unique_words: bool = False, max_length: int | None = None) -> Iterator[FoundWord]:
+    """
+    Yields the words in a grid as they're found, using the shared default lexicon - see Game.iter_words()
+    """
+    return Game().iter_words(character_2d_array, longest_first, limit, unique_words, max_length)
+
+
+ENGINES = ('auto', 'iterative', 'recursive', 'scan')
+DEFAULT_ENGINE = 'auto'
+
 
 class Game():
     """
-    Holds dictionary/prefix data and resultant data from all searches
+    Holds a reference to the shared dictionary and resultant data from all searches
     conducting in a game
     """
 
-    prefixes: set # all possible prefixes 1-3 letters in english dictionary
-    prefixes_to_words: dict[str, set[str]] # all 3 letter prefixes associated with a set of their words
-    all_search_results: list[SearchResults] # contains all data related to each of the game's searches
-
-    def __init__(self):
-        self.create_hashes()
-        self.all_search_results = []
+    load_time: float # seconds create_hashes() took to get the lexicon - reported by the next search's stats, then reset
+    all_search_results: 'SearchHistory' # the game's most recent searches, plus totals over all of them
+    cache: 'ResultCache | None' # solved boards, shared by rotations/reflections - see Cache.py
+    scoring: ScoringModel # points per word for every search - see Scoring.py
+    incremental: 'IncrementalSolver | None' # last board solved by resolve() - see Incremental.py
+
+    def __init__(self, lexicon: str | Lexicon = DEFAULT_LEXICON, cache: 'ResultCache | None' = None,
+                 scoring: ScoringModel = DEFAULT_SCORING, history: 'SearchHistory | None' = None):
+        from classes.History import SearchHistory
+        # looked up by the first solve - see the lexicon property
+        self._lexicon = lexicon
+        self.load_time = 0.0
+        # keeps the last DEFAULT_HISTORY_SIZE searches unless given a history with another retention policy
+        self.all_search_results = history if history is not None else SearchHistory()
+        self.cache = cache
+        self.scoring = scoring
+        self.incremental = None
     
-    def find_words(self, character_2d_array: list[list[str]]) -> None:
+    def find_words(self, character_2d_array: list[list[str]], unique_words: bool = False,
+                   engine: str = DEFAULT_ENGINE, max_length: int | None = None,
+                   workers: int | None = None, chunksize: int | None = None, stats: bool = False) -> None:
         """
-        Finds all possible words within the grid - using Search object's recursive_solver() method
+        Finds all possible words within the grid - using Search object's iterative_solver() method,
+        or recursive_solver() with engine='recursive' (both find the same words in the same order),
+        or checking dictionary words against the board with engine='scan' (same words and paths,
+        grouped by word - see Scan.py). The default, 'auto', picks between the iterative DFS and the
+        scan by board size and letter diversity.
+
+        unique_words keeps a single path per distinct word, for callers that don't need every traversal
+        max_length caps the number of letters in a word - defaults to the number of letters on the board
+        Grids can be rectangular, have blocked cells ('', '.', '#', or short columns) and hold
+        multi-letter tiles such as "qu" - see Board.py
+        workers > 1 spreads the starting cells (chunksize per task) across a process pool - see Parallel.py -
+        and gives the same results as a sequential solve
+        stats records node counts and per-phase timings in the results' stats attribute - see Stats.py
 
         Resultant data (SearchResults object) is appended to the all_search_results attribute
         """
-        results = SearchResults()
-        new_search = Search(character_2d_array)
-        for letter in new_search.letters_1d:
-            new_search.recursive_solver(letter, results, first_call=True)
-
-        # modifies/finds results
-        results.eliminate_duplicates()
-        results.find_data()
-        # sorting alphabetically
-        results.words_by_character = sorted(list(results.words_by_character))
-        # finding runtime
-        results.search_time = round(time() - results.search_time, 2)
+        results = self.search(character_2d_array, unique_words, engine, max_length, workers, chunksize, stats)
         # adds results to list of searches
         self.all_search_results.append(results)
+
+    def search(self, character_2d_array: list[list[str]], unique_words: bool = False,
+               engine: str = DEFAULT_ENGINE, max_length: int | None = None,
+               workers: int | None = None, chunksize: int | None = None, stats: bool = False) -> SearchResults:
+        """
+        Same as find_words() but returns the SearchResults instead of keeping them in all_search_results
+
+        With a cache, boards (or their rotations/reflections) solved before aren't searched again
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown search engine '{engine}' - expected one of {ENGINES}")
+        lexicon = self.lexicon # the first search of a game looks the lexicon up
+        # only the search that looked the lexicon up reports the time it took
+        load_time, self.load_time = self.load_time, 0.0
+        search_stats = None
+        if stats:
+            search_stats = SearchStats()
+            if load_time:
+                search_stats.phase_times['create_hashes'] = load_time
+        with phase(search_stats, 'search_setup'):
+            new_search = Search(character_2d_array, lexicon, max_length)
+        results = SearchResults(new_search.board.height, unique_words, search_stats, self.scoring)
+        if self.cache is None:
+            self.solve(new_search, results, engine, workers, chunksize)
+        else:
+            with phase(search_stats, 'cache_lookup'):
+                found_words = self.cache.get(new_search.board, self.lexicon)
+            if found_words is None:
+                # cache entries hold every path with no length cap
+                full_results = SearchResults(new_search.board.height, stats=search_stats)
+                self.solve(Search(character_2d_array, self.lexicon), full_results, engine, workers, chunksize)
+                found_words = full_results.words_found
+                with phase(search_stats, 'cache_store'):
+                    self.cache.put(new_search.board, self.lexicon, found_words)
+            with phase(search_stats, 'add_words'):
+                for found_word in found_words:
+                    if len(found_word.word) <= new_search.max_length:
+                        results.add_word(found_word)
+
+        # sorting alphabetically and finding runtime
+        with phase(search_stats, 'finish'):
+            results.finish()
+        return results
+
+    def iter_words(self, character_2d_array: list[list[str]], longest_first: bool = False,
+                   limit: int | None = None, unique_words: bool = False, max_length: int | None = None) -> Iterator[FoundWord]:
+        """
+        Yields (word, path) FoundWords as soon as the search finds them - nothing is kept in all_search_results
+
+        limit stops the search once that many words have been yielded (as does simply breaking out of
+        the loop). longest_first has to search the whole board before yielding anything - words then
+        come out longest first, in discovery order within a length. unique_words yields each word once.
+        """
+        found_words = Search(character_2d_array, self.lexicon, max_length).iter_words()
+        if unique_words:
+            found_words = unique(found_words)
+        if longest_first:
+            # both are stable - ties stay in discovery order
+            if limit is None:
+                found_words = iter(sorted(found_words, key=word_length, reverse=True))
+            else:
+                found_words = iter(nlargest(limit, found_words, key=word_length))
+        return islice(found_words, limit)
+
+    def resolve(self, character_2d_array: list[list[str]], max_length: int | None = None) -> 'SolveDiff':
+        """
+        Like find_words(), but for a board that differs from the last resolve()d one in a few cells -
+        only paths that can reach a changed cell are searched again (see Incremental.py)
+
+        The full results are appended to all_search_results; returns the words added and removed
+        """
+        from classes.Incremental import IncrementalSolver
+        if self.incremental is None or self.incremental.lexicon is not self.lexicon:
+            self.incremental = IncrementalSolver(self.lexicon)
+        results, diff = self.incremental.solve(character_2d_array, max_length)
+        self.all_search_results.append(results)
+        return diff
+
+    def top_k(self, character_2d_array: list[list[str]], k: int, max_length: int | None = None) -> SearchResults:
+        """
+        Finds the k highest scoring distinct words without enumerating every path (see Search.iter_best_words())
+
+        Returns SearchResults holding one path per word, best first - words tied on score come out in no
+        particular order. Nothing is kept in all_search_results.
+        """
+        new_search = Search(character_2d_array, self.lexicon, max_length)
+        results = SearchResults(new_search.board.height, unique_words=True, scoring=self.scoring)
+        for found_word in new_search.iter_best_words(self.scoring):
+            if len(results.words_found) >= k:
+                break
+            results.add_word(found_word)
+        results.finish()
+        return results
+
+    def solve(self, search: 'Search', search_results: SearchResults, engine: str = DEFAULT_ENGINE,
+              workers: int | None = None, chunksize: int | None = None) -> None:
+        """
+        Runs the chosen engine from every starting cell of the search - on a process pool if workers > 1
+        The dictionary scan always runs in this process, checking the whole board at once
+
+        With stats on the results, the lexicon is wrapped to count every lookup - words are
+        added (and deduplicated) as they're found, so that work is timed as part of 'solve'
+        """
+        stats = search_results.stats
+        if engine in ('auto', 'scan'):
+            from classes.Scan import choose_engine, scan_words
+            # tiles are left to the DFS
+            engine = choose_engine(search.board, search.lexicon) if engine == 'auto' or search.board.tiles else engine
+            if engine == 'scan':
+                with phase(stats, 'solve'):
+                    for found_word in scan_words(search):
+                        if stats is not None:
+                            stats.dictionary_hits += 1
+                        search_results.add_word(found_word)
+                return
+        if workers is not None and workers > 1:
+            from classes.Parallel import parallel_solve
+            with phase(stats, 'solve'):
+                parallel_solve(search, search_results, workers, chunksize)
+            return
+        if stats is not None:
+            search.lexicon = InstrumentedLexicon(search.lexicon, stats)
+        with phase(stats, 'solve'):
+            for index in search.board.open_cells:
+                if engine == 'iterative':
+                    search.iterative_solver(index, search_results)
+                else:
+                    search.recursive_solver(index, search_results, first_call=True)
     
-    def create_hashes(self) -> None:
-        """
-        Creates a hashset and a hashmap:
-            - hashset contains all possible 1, 2, and 3 letter prefixes.
-            - hashmap associates every possible 3 letter prefix with a set of its words
-        
-        'pre' is the 3-letter prefix with the largest number of words: 225
-
-        hashset: {'a', 'ba', 'tor', ...}
-        hashmap: {'tor': {'torn', 'torch', ...}, 'tra': {'train', 'trade', ...} ...}
-
-        Assigns these hash structures to prefixes (set) and prefixes_to_words (dict) attributes
-        """
-
-        prefixes = set()
-        prefixes_to_words = defaultdict(set)
-
-        with open('./classes/long_wordlist.txt') as f:
-            for line in f:
-                word = line.strip()
-                # game only accepts 3 letter words
-                if len(word) >= 3:
-                    # adding prefix if not already existent
-                    if word[0] not in prefixes:
-                        prefixes.add(word[0])
-                    if word[:2] not in prefixes:
-                        prefixes.add(word[:2])
-                    if word[:3] not in prefixes:
-                        prefixes.add(word[:3])
-                    
-                    # adding all words to dictionary
-                    prefixes_to_words[word[:3]].add(word)
-    
-        self.prefixes = prefixes
-        self.prefixes_to_words = prefixes_to_words
+    def create_hashes(self, lexicon: str | Lexicon = DEFAULT_LEXICON) -> None:
+        """
+        Points the game at the process-wide lexicon - built from the word list on first use only
+
+        Assigns the lexicon (a backend name like 'trie'/'hash' or a Lexicon instance) to the lexicon attribute -
+        Game() leaves this to the first solve, so creating a game costs nothing
+
+        With the default 'auto' backend, a compiled DAWG (python -m classes.Dawg build) is memory-mapped
+        when it exists - otherwise the text word list is parsed
+        """
+        start_time = perf_counter()
+        self._lexicon = get_lexicon(lexicon) if isinstance(lexicon, str) else lexicon
+        self.load_time = perf_counter() - start_time
+
+    @property
+    def lexicon(self) -> Lexicon:
+        """
+        Shared lexicon engine walked by the solver - a backend name given to the constructor is only
+        looked up (and the lexicon built, if it's the first in the process) when first needed
+        """
+        if isinstance(self._lexicon, str):
+            self.create_hashes(self._lexicon)
+        return self._lexicon # type: ignore
 
+    @property
+    def dictionary(self) -> Dictionary:
+        """
+        Shared, immutable prefix/word hash data - only parsed from the word list when first accessed
+        """
+        return get_dictionary()
 
-class Search(Game):
+    @property
+    def prefixes(self) -> frozenset[str]:
+        """
+        All possible prefixes 1-3 letters in english dictionary
+        """
+        return self.dictionary.prefixes
+
+    @property
+    def prefixes_to_words(self) -> Mapping[str, frozenset[str]]:
+        """
+        All 3 letter prefixes associated with a set of their words
+        """
+        return self.dictionary.prefixes_to_words
+
+
+class Search():
     """
-    Recursive word search algorithm
+    Recursive and iterative word search algorithms
+
+    Runs on a Board (flat character buffer + cached neighbor table) and tracks the cells used by the
+    current branch in a bitmask, so nothing is allocated or reset per starting cell. Letter objects
+    are only built - as views over the board - when letters_2d / letters_1d are accessed.
     """
-    letters_2d: list[list[Letter]] # 2d array of game letters - first key is the column - second key is the row
-    letters_1d: list[Letter] # 1d array of game letters
+    lexicon: Lexicon # shared lexicon engine - never rebuilt per search
+    board: Board # characters and neighbor indices of the grid
     length: int # length/width of grid
+    max_length: int # most letters a word can have - the number of letters on the board unless capped
     current_word: str # the search branch's current word
-    letters_traversed: list[Letter] # subsequent Letter objects in current traversal
+    path_traversed: list[int] # subsequent cell indices in current traversal
     
-    def __init__(self, characters_2d: list[list[str]]):
-        super().__init__()
-        self.length = len(characters_2d)
-        self.letters_2d = [[] for _ in range(self.length)] # to be populated
-        self.set_letter_coordinates_and_characters(characters_2d)
-        self.flatten_letters_2d()
-        self.set_neighbors()
+    def __init__(self, characters_2d: list[list[str]], lexicon: Lexicon | None = None, max_length: int | None = None):
+        self.lexicon = lexicon if lexicon is not None else get_lexicon()
+        self.board = Board(characters_2d)
+        self.length = self.board.width
+        self.max_length = self.board.letter_count() if max_length is None else max_length
         self.current_word = ""
-        self.letters_traversed = []
+        self.path_traversed = []
+        self._letters_2d = None
+        self._characters = None
+        self._step = None
 
-    def flatten_letters_2d(self) -> None:
+    @property
+    def letters_2d(self) -> list[list[Letter]]:
         """
-        Converts the 2d array of Letter objects into a 1d array for ease of use
-
-        1d list of Letter objects is assigned to letters_1d attribute
+        2d array of Letter views over the board - first key is the column - second key is the row
         """
-        # looping through grid
-        letters_1d = []
-        for col in self.letters_2d:
-            for letter in col:
-                letters_1d.append(letter)
-
-        self.letters_1d = letters_1d
+        if self._letters_2d is None:
+            self._letters_2d = [[] for _ in range(self.board.width)] # to be populated
+            self.set_letter_coordinates_and_characters()
+            self.set_neighbors()
+        return self._letters_2d
+
+    @property
+    def letters_1d(self) -> list[Letter]:
+        """
+        1d array of Letter views - in flat index order
+        """
+        return [letter for col in self.letters_2d for letter in col]
 
-    def set_letter_coordinates_and_characters(self, characters_2d) -> None:
+    def set_letter_coordinates_and_characters(self) -> None:
         """
         Populates the letters_2d attribute with appropriate letter objects
         """
-        for x in range(self.length):
-            for y in range(self.length):
-                character = characters_2d[x][y]
-                self.letters_2d[x].append(Letter(character, (x, y)))
+        for index in range(len(self.board)):
+            x, y = self.board.coordinates(index)
+            self._letters_2d[x].append(Letter(self.board.character(index), (x, y), index)) # type: ignore
 
     def set_neighbors(self) -> None:
         """
         Attributes neighbors to every Letter object
 
         A neighbor of Letter1 is another Letter object adjacent to Letter1,
-        meaning touching sides or corners
-        """
-        # looping over columns
-        for x, col in enumerate(self.letters_2d):
-            # looping over rows
-            for y, letter in enumerate(col):
-                # adding neighbors if they exist
-                for i in range(-1, 2):
-                    for j in range(-1, 2):
-                        neighbor_coordinates = x+i, y+j
-                        # skipping if the current neighbor is the letter itself
-                        if i == 0 and j == 0:
-                            pass
-                        else:
-                            # index out of range means letter is on an edge
-                            if neighbor_coordinates[0] == -1 or neighbor_coordinates[0] == self.length \
-                            or neighbor_coordinates[1] == -1 or neighbor_coordinates[1] == self.length:
-                                pass
-                            # index is valid and neighbor exists
-                            else:
-                                neighbor = self.letters_2d[neighbor_coordinates[0]][neighbor_coordinates[1]]
-                                letter.neighbors.append(neighbor)
+        meaning touching sides or corners - read from the board's neighbor table
+        """
+        letters_1d = self.letters_1d
+        for letter in letters_1d:
+            letter.neighbors = [letters_1d[index] for index in self.board.neighbors[letter.index]]
             
-    def check_dictionary(self, search_results: SearchResults) -> None:
+    @property
+    def characters(self) -> list[str]:
         """
-        Checks if the current word is an actual word and not already in the dictionary
+        Each cell's character (or tile) in flat index order - '' for blocked cells
+        """
+        if self._characters is None:
+            self._characters = [self.board.character(index) for index in range(len(self.board.cells))]
+        return self._characters
+
+    def step_function(self):
+        """
+        Returns the function advancing a lexicon node by one cell: lexicon.child() itself, or on boards
+        with multi-letter tiles, a wrapper walking every letter of a tile - a branch is cut as soon as
+        any of them leaves the lexicon
+
+        Built once per search (and again only if the lexicon is swapped, e.g. for stats)
+        """
+        if self._step is not None and self._step[0] is self.lexicon:
+            return self._step[1]
+        child = self.lexicon.child
+        if not self.board.tiles:
+            step = child
+        else:
+            tile_codes = {TILE_BASE + n: tuple(map(ord, tile)) for n, tile in enumerate(self.board.tiles)}
+
+            def step(node, code: int):
+                codes = tile_codes.get(code)
+                if codes is None:
+                    return child(node, code)
+                for code in codes:
+                    node = child(node, code)
+                    if node is None:
+                        return None
+                return node
+        self._step = (self.lexicon, step)
+        return step
+
+    def check_dictionary(self, search_results: SearchResults, node) -> None:
+        """
+        Checks if the current word (reached at the given lexicon node) is an actual word
         If it is, it's added to the words found then checked if it's the longest word found
         """
-        prefix = self.current_word[:3]
-        # seeing if it is an actual word
-        if self.current_word in self.prefixes_to_words[prefix]:
-            search_results.words_found.append(deepcopy(self.letters_traversed))
-            # checking if its the longest word added
-            if len(self.letters_traversed) > len(search_results.longest_word):
-                search_results.longest_word = deepcopy(self.letters_traversed)
+        # seeing if it is an actual word - tiles can push a word past max_length
+        if len(self.current_word) <= self.max_length and self.lexicon.is_word(node):
+            search_results.add_word(FoundWord(self.current_word, tuple(self.path_traversed)))
 
-    def recursive_solver(self, current_letter: Letter, search_results: SearchResults, first_call=False) -> None:
+    def recursive_solver(self, index: int, search_results: SearchResults, first_call=False, node=None, visited=0,
+                         step=None) -> None:
         """
-        Finds all possible words in the grid
-        Possible words must be <= grid_length ** 2
+        Finds all possible words in the grid starting from the cell at index
+        Possible words must be <= max_length (by default grid_length ** 2)
+
+        Walks the lexicon alongside the grid - node is the lexicon node for the current word,
+        so a branch is cut as soon as no dictionary word starts with it. visited is the bitmask
+        of cells used by the current word. step (see step_function()) is looked up by the first call
+        and passed down.
 
         Results stored through subsequent calls to check_dictionary() method,
         which modifies its search_results argument
         """
+        cells = self.board.cells
         # must reset tracking variables on initial call
         if first_call:
-            self.current_word = current_letter.character
-            self.letters_traversed = [current_letter]
-            for letter in self.letters_1d:
-                letter.currently_found = False
-            current_letter.currently_found = True
+            step = self.step_function()
+            node = step(self.lexicon.root, cells[index])
+            if node is None:
+                return
+            self.current_word = self.board.character(index)
+            self.path_traversed = [index]
+            visited = 1 << index
+
+        # only words with 3+ letters accepted
+        if len(self.current_word) >= 3:
+            self.check_dictionary(search_results, node)
 
         # word can't exceed the number of characters on the grid
-        if len(self.current_word) == self.length ** 2:
-            # could still be a valid word, though
-            self.check_dictionary(search_results)
+        if len(self.current_word) >= self.max_length:
             return
-        
+
         # all adjacent letters that haven't been found yet
-        possible_next_letters = [letter for letter in current_letter.neighbors if not letter.currently_found]
-
-        for neighbor in possible_next_letters:
-            prefix_length = len(self.current_word)
-            # checking if start of the word is a possible prefix
-            if prefix_length <= 3:
-                if self.current_word not in self.prefixes:
-                    return
-                if prefix_length < 3:
-                    # updating tracker variables
-                    self.current_word += neighbor.character
-                    self.letters_traversed.append(neighbor)
-                    neighbor.currently_found = True
-                    # finding new branch - only words with 3+ letters accepted
-                    self.recursive_solver(neighbor, search_results)
-            # current word has 3+ letters and has a valid prefix
-            if prefix_length >= 3:
-                # checking if the current word is an actual word
-                self.check_dictionary(search_results)
-
-                # checking if the current word + neighbor's character is a possible word
-                prefix = self.current_word[:3]
-                possible_big_prefix = self.current_word + neighbor.character # prefix containing 4+ characters
-                # possible words must start with the current prefix
-                possible_words = [word for word in self.prefixes_to_words[prefix] \
-                                  if len(word) >= len(possible_big_prefix) and word[:len(possible_big_prefix)] == possible_big_prefix]
-                if len(possible_words) == 0: # base case - branch is done
-                    continue
-                # more possible words to go
-                else:
-                    # updating tracker variables
-                    self.current_word = possible_big_prefix
-                    self.letters_traversed.append(neighbor)
-                    neighbor.currently_found = True
-                    # starting new branch
-                    self.recursive_solver(neighbor, search_results)
-            
+        for neighbor in self.board.neighbors[index]:
+            if visited >> neighbor & 1:
+                continue
+            # checking if the current word + neighbor's character is a possible prefix
+            next_node = step(node, cells[neighbor])
+            if next_node is None: # base case - branch is done
+                continue
+            # updating tracker variables
+            word = self.current_word
+            self.current_word += self.characters[neighbor]
+            self.path_traversed.append(neighbor)
+            # starting new branch
+            self.recursive_solver(neighbor, search_results, node=next_node, visited=visited | 1 << neighbor, step=step)
+
             # after this stage of the branch has fully been searched, tracker variables are cut/reset
-            self.current_word = self.current_word[:-1]
-            prev_letter = self.letters_traversed.pop()
-            prev_letter.currently_found = False
-        
-        # edge case where there's no possible next letters but is still a word
-        if len(possible_next_letters) == 0:
-            self.check_dictionary(search_results)
\ No newline at end of file
+            self.current_word = word
+            self.path_traversed.pop()
+
+    def iterative_solver(self, index: int, search_results: SearchResults) -> None:
+        """
+        Finds all possible words in the grid starting from the cell at index - same results, in the
+        same order, as recursive_solver() but without recursion (see iter_paths())
+        """
+        for found_word in self.iter_paths(index):
+            search_results.add_word(found_word)
+
+    def iter_paths(self, index: int) -> Iterator[FoundWord]:
+        """
+        Yields every word starting from the cell at index as soon as it's found
+        """
+        return self.walk(index)
+
+    def walk(self, start: int, min_letters: int = 3, cell_mask: int = 0,
+             keep_branch: Callable[[int, Any, int, int], bool] | None = None) -> Iterator[FoundWord]:
+        """
+        The depth-first walk behind iter_paths(), iter_paths_through() and iter_long_words() - yields
+        the words of min_letters+ letters starting from the cell at start as soon as they're found
+
+        cell_mask: only words whose path uses one of these cells are yielded (any word if 0)
+        keep_branch(cell, node, visited, letters): called before a branch steps onto a cell (the start
+        cell included) - cell's lexicon node, the cells visited before it and the word's letters with
+        it - and the branch is cut unless it returns True
+
+        Each stack frame holds (cell index, lexicon node, visited bitmask, word so far, path depth).
+        Children are pushed in reverse neighbor order so they're popped in the order recursive_solver
+        visits them. The current path is kept in a single list, cut back to each popped frame's depth.
+        """
+        cells = self.board.cells
+        neighbors = self.board.neighbors
+        characters = self.characters
+        step = self.step_function()
+        is_word = self.lexicon.is_word
+        max_length = self.max_length
+
+        node = step(self.lexicon.root, cells[start])
+        if node is None or (keep_branch is not None and not keep_branch(start, node, 0, len(characters[start]))):
+            return
+        path = []
+        stack = [(start, node, 1 << start, characters[start], 1)]
+
+        while stack:
+            index, node, visited, word, depth = stack.pop()
+            del path[depth - 1:]
+            path.append(index)
+            letters = len(word)
+
+            # only words with 3+ letters accepted - tiles can push a word past max_length
+            if min_letters <= letters <= max_length and (not cell_mask or visited & cell_mask) and is_word(node):
+                yield FoundWord(word, tuple(path))
+
+            # word can't exceed the number of letters on the grid
+            if letters >= max_length:
+                continue
+
+            for neighbor in reversed(neighbors[index]):
+                if visited >> neighbor & 1:
+                    continue
+                next_node = step(node, cells[neighbor])
+                if next_node is None:
+                    continue
+                next_word = word + characters[neighbor]
+                if keep_branch is not None and not keep_branch(neighbor, next_node, visited, len(next_word)):
+                    continue
+                stack.append((neighbor, next_node, visited | 1 << neighbor, next_word, depth + 1))
+
+    def iter_paths_through(self, cell_mask: int) -> Iterator[FoundWord]:
+        """
+        Yields every word in the grid whose path uses at least one of the cells in cell_mask
+
+        Same walk as iter_paths(), but a branch that hasn't touched the masked cells yet is cut as
+        soon as the nearest one is further away than the letters it has left - by max_length, or by
+        the longest word its prefix can still become (lexicon.max_suffix()). Cell distances come from
+        a breadth-first search out of the masked cells.
+        """
+        neighbors = self.board.neighbors
+        max_suffix = self.lexicon.max_suffix
+        max_length = self.max_length
+
+        # steps from each cell to the nearest masked cell - unreachable cells stay past max_length
+        distances = [max_length + 1] * len(self.board.cells)
+        frontier = [index for index in self.board.open_cells if cell_mask >> index & 1]
+        for index in frontier:
+            distances[index] = 0
+        while frontier:
+            next_frontier = []
+            for index in frontier:
+                for neighbor in neighbors[index]:
+                    if distances[neighbor] > distances[index] + 1:
+                        distances[neighbor] = distances[index] + 1
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+
+        def within_reach(cell: int, node, visited: int, letters: int) -> bool:
+            if visited & cell_mask:
+                return True
+            if letters + distances[cell] > max_length:
+                return False
+            suffix = max_suffix(node)
+            return suffix is None or distances[cell] <= suffix
+
+        for start in self.board.open_cells:
+            yield from self.walk(start, cell_mask=cell_mask, keep_branch=within_reach)
+
+    def iter_best_words(self, scoring: ScoringModel = DEFAULT_SCORING) -> Iterator[FoundWord]:
+        """
+        Yields every word in the grid, highest score first - stop iterating once you have enough
+
+        Best-first branch and bound: every branch (from every starting cell at once) waits in a
+        priority queue keyed by an upper bound on the best word it can still reach - the scoring
+        model's bound() for the most letters the branch can still add (the lexicon's max_suffix(),
+        capped by max_length). A found word is queued under its actual score, so it's only yielded
+        once no waiting branch could beat it. Branches whose bound is 0 are dropped entirely.
+        """
+        cells = self.board.cells
+        neighbors = self.board.neighbors
+        characters = self.characters
+        step = self.step_function()
+        is_word = self.lexicon.is_word
+        max_suffix = self.lexicon.max_suffix
+        max_length = self.max_length
+        bound = scoring.bound
+
+        def branch_bound(node, word: str) -> int:
+            suffix = max_suffix(node)
+            letters = max_length if suffix is None else min(max_length, len(word) + suffix)
+            return bound(word, letters) if len(word) <= letters else 0
+
+        # (-score or -bound, 0 for words / 1 for branches, tie breaker, word or branch)
+        queue = []
+        pushed = 0
+        for index in self.board.open_cells:
+            node = step(self.lexicon.root, cells[index])
+            if node is not None and (upper := branch_bound(node, characters[index])) > 0:
+                heappush(queue, (-upper, 1, pushed, (index, node, 1 << index, characters[index], (index,))))
+                pushed += 1
+
+        while queue:
+            _, kind, _, item = heappop(queue)
+            if kind == 0:
+                yield item
+                continue
+            index, node, visited, word, path = item
+            letters = len(word)
+            if 3 <= letters <= max_length and is_word(node):
+                heappush(queue, (-scoring.score(word), 0, pushed, FoundWord(word, path)))
+                pushed += 1
+            if letters >= max_length:
+                continue
+            for neighbor in neighbors[index]:
+                if visited >> neighbor & 1:
+                    continue
+                next_node = step(node, cells[neighbor])
+                if next_node is None:
+                    continue
+                next_word = word + characters[neighbor]
+                upper = branch_bound(next_node, next_word)
+                if upper > 0:
+                    heappush(queue, (-upper, 1, pushed, (neighbor, next_node, visited | 1 << neighbor, next_word, path + (neighbor,))))
+                    pushed += 1
+
+    def iter_words(self) -> Iterator[FoundWord]:
+        """
+        Yields every word in the grid, starting cell by starting cell, as soon as it's found
+        """
+        for index in self.board.open_cells:
+            yield from self.iter_paths(index)
+
+    def iter_long_words(self, min_letters: int) -> Iterator[FoundWord]:
+        """
+        Yields every word of at least min_letters letters in the grid, as soon as it's found
+
+        Same walk as iter_paths(), but a branch is cut as soon as the longest word its prefix can still
+        become (lexicon.max_suffix()) is too short - on most boards that leaves very little to search.
+        """
+        max_suffix = self.lexicon.max_suffix
+        min_letters = max(min_letters, 3)
+        if min_letters > self.max_length:
+            return
+
+        def long_enough(cell: int, node, visited: int, letters: int) -> bool:
+            suffix = max_suffix(node)
+            return suffix is None or letters + suffix >= min_letters
+
+        for start in self.board.open_cells:
+            yield from self.walk(start, min_letters, keep_branch=long_enough)
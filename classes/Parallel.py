@@ -0,0 +1,122 @@
+"""
+Contains the parallel solve mode - starting cells spread across a process pool:
+
+- get_pool(): returns a process pool for a worker count / lexicon, created once and reused
+- discard_pool(): drops a shared pool (one broken by a dead worker) so the next get_pool() makes a new one
+- parallel_solve(): solves a Search's starting cells in chunks on the pool and merges the words found
+
+Notes:
+Each starting cell's subtree is independent, so chunks of starting cells are solved separately and
+merged back in starting-cell order - the merged SearchResults match a sequential solve exactly.
+
+Workers are forked where the platform allows it, so they inherit the parent's lexicon (and the pages
+of a memory-mapped DAWG) instead of receiving a pickled copy. With the spawn start method, workers
+look the lexicon up by backend name and load it themselves.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+
+from classes.Lexicon import Lexicon, get_lexicon
+from classes.Nodes import FoundWord, Search, SearchResults
+
+
+_worker_lexicon: Lexicon | None = None
+
+_pools: dict[tuple[int, int], ProcessPoolExecutor] = {}
+_pools_lock = Lock()
+
+
+def _init_worker(lexicon: Lexicon | str) -> None:
+    global _worker_lexicon
+    _worker_lexicon = get_lexicon(lexicon) if isinstance(lexicon, str) else lexicon
+
+
+def worker_lexicon() -> Lexicon:
+    """
+    Returns the lexicon a pool worker was started with - only meaningful inside a worker
+    """
+    assert _worker_lexicon is not None, "not running in a pool worker"
+    return _worker_lexicon
+
+
+def _solve_cells(characters_2d: list[list[str]], start_cells: tuple[int, ...], max_length: int | None) -> list[FoundWord]:
+    """
+    Runs the iterative solver from each starting cell - words found are returned in discovery order
+    """
+    search = Search(characters_2d, worker_lexicon(), max_length)
+    results = SearchResults(search.board.height)
+    for index in start_cells:
+        search.iterative_solver(index, results)
+    return results.words_found
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def get_pool(workers: int, lexicon: Lexicon) -> ProcessPoolExecutor:
+    """
+    Returns the shared process pool for a worker count and lexicon, creating it on the first call
+    """
+    key = (workers, id(lexicon))
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                if 'fork' in multiprocessing.get_all_start_methods():
+                    context = multiprocessing.get_context('fork')
+                    initargs = (lexicon,) # inherited through fork - never pickled
+                else:
+                    context = multiprocessing.get_context()
+                    initargs = (lexicon.name,)
+                pool = ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker, initargs=initargs)
+                _pools[key] = pool
+    return pool
+
+
+def discard_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Drops a pool from the shared pools and shuts it down - the next get_pool() for it creates a new one
+    """
+    with _pools_lock:
+        for key in [key for key, shared_pool in _pools.items() if shared_pool is pool]:
+            del _pools[key]
+    pool.shutdown(wait=False)
+
+
+def shutdown_pools() -> None:
+    """
+    Shuts down every shared pool - they're recreated on the next parallel solve
+    """
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown()
+        _pools.clear()
+
+
+def parallel_solve(search: Search, search_results: SearchResults,
+                   workers: int | None = None, chunksize: int | None = None) -> None:
+    """
+    Solves every starting cell of the search on a process pool, adding the words found to search_results
+
+    chunksize is the number of starting cells per task - by default the cells are split into
+    about four tasks per worker, so slow corners of the board don't leave workers idle
+    """
+    workers = workers or default_workers()
+    start_cells = search.board.open_cells
+    cell_count = len(start_cells)
+    if chunksize is None:
+        chunksize = max(1, -(-cell_count // (workers * 4)))
+    chunks = [start_cells[start:start + chunksize] for start in range(0, cell_count, chunksize)]
+
+    characters_2d = search.board.to_2d()
+    pool = get_pool(workers, search.lexicon)
+    futures = [pool.submit(_solve_cells, characters_2d, chunk, search.max_length) for chunk in chunks]
+    # merging in starting cell order - same order as a sequential solve
+    for future in futures:
+        for found_word in future.result():
+            search_results.add_word(found_word)
@@ -0,0 +1,171 @@
+"""
+Contains the vectorized (NumPy) batch prefilter for solving many boards at once:
+
+- WordMatrix: a lexicon's a-z words as arrays - letter masks, letter counts and bigram indexes
+- encode_boards(): boards of one shape as a uint8 array of letter indexes
+- board_features(): letter histograms and adjacency-bigram presence matrices for a whole batch
+- candidate_words(): the words that fit each board's letters and bigrams
+- solve_boards(): prefilters a batch, then verifies each board's candidates with the scan engine
+
+Notes:
+Letters are indexed a=0 ... z=25; 26 stands for a blocked cell. Bigram b1 -> b2 is index b1 * 27 + b2,
+and BIGRAM_ALWAYS (26 * 27 + 26) is set on every board so words can be padded with it.
+
+Everything up to the candidate lists runs as array operations over the batch: one pass builds every
+board's histogram and bigram matrix, and each board's words are narrowed with three vector tests
+(letter mask subset, letter counts, bigram presence) over the lexicon. Only the surviving words are
+checked against the board in Python (Scan.word_paths).
+
+NumPy is an optional dependency - solve_boards() raises ImportError without it. Boards with
+multi-letter tiles or non a-z letters are handed to the regular solver.
+"""
+
+from classes.Board import Board, neighbor_table
+from classes.Lexicon import Lexicon
+from classes.Nodes import FoundWord, Game, Search, SearchResults
+from classes.Scan import letter_masks, neighbor_masks, shift_masks, word_paths
+
+try:
+    import numpy as np
+except ImportError: # optional dependency
+    np = None
+
+
+BLOCKED_LETTER = 26
+BIGRAM_ALWAYS = BLOCKED_LETTER * 27 + BLOCKED_LETTER
+BIGRAM_COUNT = BIGRAM_ALWAYS + 1
+
+
+def require_numpy() -> None:
+    if np is None:
+        raise ImportError("The batch prefilter needs NumPy - pip install numpy")
+
+
+class WordMatrix():
+    """
+    A lexicon's a-z words as parallel arrays - built once per lexicon
+    """
+    words: list[str]
+    masks: 'np.ndarray' # uint32 bitmask of the letters in each word
+    counts: 'np.ndarray' # uint8 words x 26 letter counts
+    bigrams: 'np.ndarray' # int16 words x (longest word - 1) bigram indexes, padded with BIGRAM_ALWAYS
+    lengths: 'np.ndarray' # uint8 letters in each word
+
+    def __init__(self, lexicon: Lexicon):
+        require_numpy()
+        words = [word for word in lexicon.words() if word.isascii() and word.isalpha() and word.islower()]
+        longest = max(map(len, words), default=1)
+        letters = np.full((len(words), longest), BLOCKED_LETTER, dtype=np.int16)
+        for row, word in enumerate(words):
+            letters[row, :len(word)] = np.frombuffer(word.encode(), dtype=np.uint8) - ord('a')
+
+        used = letters < BLOCKED_LETTER
+        self.words = words
+        self.lengths = used.sum(1).astype(np.uint8)
+        self.counts = np.zeros((len(words), 27), dtype=np.uint8)
+        np.add.at(self.counts, (np.arange(len(words))[:, None], letters), 1)
+        self.counts = self.counts[:, :BLOCKED_LETTER]
+        self.masks = np.bitwise_or.reduce(np.where(used, np.left_shift(1, letters, dtype=np.int64), 0), axis=1).astype(np.uint32)
+        # pairs running past a word's end read blocked -> blocked, which every board has
+        self.bigrams = letters[:, :-1] * 27 + letters[:, 1:] if longest > 1 else np.zeros((len(words), 0), dtype=np.int16)
+        self.bigrams[~used[:, 1:]] = BIGRAM_ALWAYS
+
+
+def get_word_matrix(lexicon: Lexicon) -> WordMatrix:
+    """
+    Returns the WordMatrix of a lexicon, building it on the first call - kept on the lexicon, like its fingerprint
+    """
+    matrix = lexicon.__dict__.get('_word_matrix')
+    if matrix is None:
+        matrix = WordMatrix(lexicon)
+        lexicon.__dict__['_word_matrix'] = matrix
+    return matrix
+
+
+def encode_boards(boards: list[Board]) -> 'np.ndarray':
+    """
+    Returns boards of one shape as a boards x cells uint8 array of letter indexes (26 = blocked)
+    """
+    require_numpy()
+    codes = np.frombuffer(b''.join(board.cells for board in boards), dtype=np.uint8).reshape(len(boards), -1)
+    return np.where(codes == 0, BLOCKED_LETTER, codes - ord('a')).astype(np.uint8)
+
+
+def board_features(encoded: 'np.ndarray', width: int, height: int) -> tuple['np.ndarray', 'np.ndarray']:
+    """
+    Returns every board's letter histogram (boards x 26) and bigram presence matrix (boards x BIGRAM_COUNT)
+
+    Blocked cells only form bigrams with a blocked letter, so they never make a word fit
+    """
+    board_count = len(encoded)
+    rows = np.arange(board_count)[:, None]
+    counts = np.zeros((board_count, 27), dtype=np.int32)
+    np.add.at(counts, (rows, encoded), 1)
+
+    table = neighbor_table(width, height)
+    sources = np.array([index for index, neighbors in enumerate(table) for _ in neighbors], dtype=np.intp)
+    targets = np.array([neighbor for neighbors in table for neighbor in neighbors], dtype=np.intp)
+    first, second = encoded[:, sources].astype(np.int16), encoded[:, targets].astype(np.int16)
+    # a pair touching a blocked cell becomes blocked -> blocked
+    blocked = (first == BLOCKED_LETTER) | (second == BLOCKED_LETTER)
+    pairs = np.where(blocked, BIGRAM_ALWAYS, first * 27 + second)
+    present = np.zeros((board_count, BIGRAM_COUNT), dtype=bool)
+    present[rows, pairs] = True
+    present[:, BIGRAM_ALWAYS] = True
+    return counts[:, :BLOCKED_LETTER], present
+
+
+def candidate_words(matrix: WordMatrix, counts: 'np.ndarray', present: 'np.ndarray',
+                    max_lengths: list[int]) -> list[list[str]]:
+    """
+    Returns, for each board, the words fitting its letter counts, bigrams and length cap
+    """
+    board_masks = np.bitwise_or.reduce(np.where(counts > 0, np.left_shift(1, np.arange(BLOCKED_LETTER)), 0), axis=1)
+    candidates = []
+    for row, max_length in enumerate(max_lengths):
+        words = np.flatnonzero((matrix.masks & np.uint32(~int(board_masks[row]) & 0xFFFFFFFF)) == 0)
+        words = words[matrix.lengths[words] <= max_length]
+        words = words[(matrix.counts[words] <= counts[row]).all(1)]
+        words = words[present[row][matrix.bigrams[words]].all(1)]
+        candidates.append([matrix.words[index] for index in words])
+    return candidates
+
+
+def vectorizable(board: Board) -> bool:
+    return not board.tiles and all(code == 0 or 97 <= code <= 122 for code in board.cells)
+
+
+def solve_boards(boards: list[list[list[str]]], game: Game, unique_words: bool = False) -> list[SearchResults]:
+    """
+    Solves a batch of boards, prefiltering the dictionary for all of them at once - results in input order
+
+    Words and paths match game.search(), grouped by word
+    """
+    require_numpy()
+    searches = [Search(board, game.lexicon) for board in boards]
+    results: list[SearchResults | None] = [None] * len(boards)
+
+    shapes: dict[tuple[int, int], list[int]] = {}
+    for position, search in enumerate(searches):
+        if vectorizable(search.board):
+            shapes.setdefault((search.board.width, search.board.height), []).append(position)
+        else:
+            results[position] = game.search(boards[position], unique_words)
+
+    matrix = get_word_matrix(game.lexicon) if shapes else None
+    for (width, height), positions in shapes.items():
+        encoded = encode_boards([searches[position].board for position in positions])
+        counts, present = board_features(encoded, width, height)
+        candidates = candidate_words(matrix, counts, present, [searches[position].max_length for position in positions]) # type: ignore
+        for position, words in zip(positions, candidates):
+            board = searches[position].board
+            letters = letter_masks(board)
+            neighbors = neighbor_masks(board.width, board.height, board.blocked)
+            shifts = shift_masks(board.width, board.height, board.blocked)
+            search_results = SearchResults(board.height, unique_words, scoring=game.scoring)
+            for word in words:
+                for path in word_paths(word, letters, neighbors, shifts):
+                    search_results.add_word(FoundWord(word, path))
+            search_results.finish()
+            results[position] = search_results
+    return results # type: ignore
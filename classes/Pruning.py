@@ -0,0 +1,128 @@
+"""
+Contains the board-level dictionary filter the scan engine (Scan.py) starts from:
+
+- WordTable: a lexicon's words grouped by the set of letters they use - built once per lexicon
+- board_profile(): letter counts and adjacent letter pairs (bigrams) a board can form
+- board_words(): every dictionary word that fits a board's letter counts and bigrams
+
+Notes:
+A word can only be spelled on a board if the board has enough copies of each of its letters and
+every pair of consecutive letters sits on two touching cells somewhere on the board. Neither check
+looks at whole paths, so the filtered list still holds words the board can't spell - it just holds
+far fewer of them.
+
+Words are grouped by a bitmask of their letters (bit n set = character code n used), so the first
+filter is one int test per group: the group's mask must be a subset of the board's. The bigram
+filter is a single regex per board matching any letter pair the board can't form.
+
+The DFS never needs this filter: it only ever extends a path to a touching cell, so every prefix it
+looks up already fits the board's letters and bigrams, and a DFS solve costs less than the filter.
+"""
+
+import re
+from collections import Counter
+
+from classes.Board import Board
+from classes.Lexicon import Lexicon
+
+
+def letter_mask(codes) -> int:
+    """
+    Returns the bitmask of a sequence of character codes
+    """
+    mask = 0
+    for code in codes:
+        mask |= 1 << code
+    return mask
+
+
+class WordTable():
+    """
+    A lexicon's words grouped by letter mask
+
+    {letter_mask('tac'): ['act', 'cat', 'tact', ...], ...}
+    """
+    groups: dict[int, list[str]] # letter mask -> words using exactly those letters
+    max_word_length: int # letters in the lexicon's longest word
+
+    def __init__(self, lexicon: Lexicon):
+        groups: dict[int, list[str]] = {}
+        max_word_length = 0
+        for word in lexicon.words():
+            groups.setdefault(letter_mask(map(ord, word)), []).append(word)
+            max_word_length = max(max_word_length, len(word))
+        self.groups = groups
+        self.max_word_length = max_word_length
+
+    def candidates(self, mask: int) -> list[str]:
+        """
+        Returns every word whose letters all appear in the mask
+        """
+        return [word for group_mask, words in self.groups.items() if group_mask & mask == group_mask for word in words]
+
+
+def get_word_table(lexicon: Lexicon) -> WordTable:
+    """
+    Returns the WordTable of a lexicon, building it on the first call - kept on the lexicon, like its fingerprint
+    """
+    word_table = lexicon.__dict__.get('_word_table')
+    if word_table is None:
+        word_table = WordTable(lexicon)
+        lexicon.__dict__['_word_table'] = word_table
+    return word_table
+
+
+def board_profile(board: Board) -> tuple[Counter, set[tuple[int, int]]]:
+    """
+    Returns the board's letter counts and the set of (code, code) letter pairs a path can form
+
+    Multi-letter tiles contribute each of their letters, the pairs inside the tile, and pairs of
+    their last letter with the first letter of every touching cell
+    """
+    cells = board.cells
+    if board.tiles:
+        letters = [tuple(map(ord, board.character(index))) for index in range(len(cells))]
+        counts = Counter(code for index in board.open_cells for code in letters[index])
+        bigrams = {pair for index in board.open_cells for pair in zip(letters[index], letters[index][1:])}
+        for index, neighbors in enumerate(board.neighbors):
+            for neighbor in neighbors:
+                bigrams.add((letters[index][-1], letters[neighbor][0]))
+        return counts, bigrams
+
+    counts = Counter(cells[index] for index in board.open_cells)
+    bigrams = set()
+    for index, neighbors in enumerate(board.neighbors):
+        for neighbor in neighbors:
+            bigrams.add((cells[index], cells[neighbor]))
+    return counts, bigrams
+
+
+def missing_bigram_pattern(counts: Counter, bigrams: set[tuple[int, int]]) -> re.Pattern:
+    """
+    Compiles a regex matching any pair of board letters that no two touching cells form
+
+    'a[^bt]|b[^a]|t[^a]' for a board where a only touches b and t
+    """
+    alternatives = []
+    for code in sorted(counts):
+        followers = ''.join(re.escape(chr(next_code)) for next_code in sorted(counts) if (code, next_code) in bigrams)
+        alternatives.append(re.escape(chr(code)) + (f'[^{followers}]' if followers else '.'))
+    return re.compile('|'.join(alternatives) or '.')
+
+
+def board_words(board: Board, lexicon: Lexicon, max_length: int | None = None) -> list[str]:
+    """
+    Returns every word in the lexicon that fits the board's letter counts and bigrams
+    """
+    counts, bigrams = board_profile(board)
+    max_length = board.letter_count() if max_length is None else max_length
+    missing_bigram = missing_bigram_pattern(counts, bigrams).search
+
+    words = []
+    for word in get_word_table(lexicon).candidates(letter_mask(counts)):
+        if len(word) > max_length or missing_bigram(word):
+            continue
+        if any(count > counts[ord(character)] for character, count in Counter(word).items()):
+            continue
+        words.append(word)
+    return words
@@ -0,0 +1,211 @@
+"""
+Contains the dictionary-scan engine - the reverse of the grid DFS:
+
+- neighbor_masks(): each cell's neighbors as a bitmask - cached per grid size, blocked cells masked out per call
+- letter_masks(): bitmask of the cells holding each letter of a board
+- shift_masks() / spreads(): whole-board neighbor expansion with bit shifts
+- word_paths(): every path spelling one word, found by expanding bitmasks letter by letter
+- scan_words(): every word in a grid, checking each dictionary word that could fit the board
+- prefix_paths(): estimates how many short paths on a board start a word
+- choose_engine(): picks the grid DFS or the dictionary scan for a board
+
+Notes:
+Instead of walking the grid and following the lexicon, the scan takes the words that fit the board's
+letter counts and bigrams (Pruning.board_words) and checks each against the board: the cells a path
+can continue to are neighbor_masks[cell] & letter_masks[next letter] & ~visited. Before any path
+is built, the word is run over the whole board at once - spreading the cells holding each letter to
+their neighbors with a handful of shifts - which rejects most words that have no path outright.
+
+It finds the same words and paths as the DFS, grouped by word rather than by starting cell. Boards
+with multi-letter tiles are left to the DFS. The scan's cost is dominated by filtering the dictionary,
+which barely depends on the board, while the DFS grows with the number of paths - choose_engine()
+estimates those from the board's letters (prefix_paths()).
+"""
+
+from functools import lru_cache
+from typing import Iterator
+
+from classes.Board import Board
+from classes.Lexicon import Lexicon
+from classes.Nodes import FoundWord, Search
+from classes.Pruning import board_words
+
+
+@lru_cache(maxsize=None)
+def grid_neighbor_masks(width: int, height: int) -> tuple[int, ...]:
+    """
+    Returns the bitmask of each cell's neighbors in a full width x height grid
+    """
+    from classes.Board import grid_neighbor_table
+    masks = []
+    for neighbors in grid_neighbor_table(width, height):
+        mask = 0
+        for neighbor in neighbors:
+            mask |= 1 << neighbor
+        masks.append(mask)
+    return tuple(masks)
+
+
+def neighbor_masks(width: int, height: int, blocked: int = 0) -> tuple[int, ...]:
+    """
+    Returns the bitmask of each cell's open neighbors in a width x height grid - 0 for blocked cells
+    """
+    masks = grid_neighbor_masks(width, height)
+    if not blocked:
+        return masks
+    return tuple(0 if blocked >> index & 1 else mask & ~blocked for index, mask in enumerate(masks))
+
+
+@lru_cache(maxsize=None)
+def grid_shift_masks(width: int, height: int) -> tuple[int, int, int, int]:
+    """
+    shift_masks() for a full width x height grid
+    """
+    first_row = last_row = 0
+    for index in range(width * height):
+        if index % height == 0:
+            first_row |= 1 << index
+        if index % height == height - 1:
+            last_row |= 1 << index
+    every_cell = (1 << width * height) - 1
+    return every_cell, every_cell ^ first_row, every_cell ^ last_row, height
+
+
+def shift_masks(width: int, height: int, blocked: int = 0) -> tuple[int, int, int, int]:
+    """
+    Returns (open cells, cells not in the first row, cells not in the last row, height) as bitmasks -
+    what spreads() needs to move a set of cells one step in every direction
+    """
+    open_mask, not_first_row, not_last_row, height = grid_shift_masks(width, height)
+    return open_mask & ~blocked, not_first_row, not_last_row, height
+
+
+def spreads(word_masks: list[int], shifts: tuple[int, int, int, int]) -> bool:
+    """
+    Returns False if the word's letters can't follow each other on the board at all - ignoring
+    that a path can't reuse a cell, so True doesn't guarantee a path
+    """
+    open_mask, not_first_row, not_last_row, height = shifts
+    reached = word_masks[0]
+    for mask in word_masks[1:]:
+        column = reached | (reached & not_first_row) >> 1 | (reached & not_last_row) << 1
+        reached = (column | column >> height | column << height) & open_mask & mask
+        if not reached:
+            return False
+    return True
+
+
+def letter_masks(board: Board) -> dict[int, int]:
+    """
+    Returns {character code: bitmask of the open cells holding it}
+    """
+    masks: dict[int, int] = {}
+    cells = board.cells
+    for index in board.open_cells:
+        masks[cells[index]] = masks.get(cells[index], 0) | 1 << index
+    return masks
+
+
+def word_paths(word: str, letters: dict[int, int], neighbors: tuple[int, ...],
+               shifts: tuple[int, int, int, int]) -> Iterator[tuple[int, ...]]:
+    """
+    Yields every path of cells spelling the word - paths are extended one letter at a time,
+    only ever trying the neighbors that hold the next letter and aren't used yet
+
+    shifts comes from shift_masks() for the board's shape
+    """
+    masks = [letters.get(ord(character), 0) for character in word]
+    if not all(masks) or not spreads(masks, shifts):
+        return
+    last = len(masks) - 1
+    stack = []
+    candidates = masks[0]
+    while candidates:
+        low = candidates & -candidates
+        candidates ^= low
+        stack.append((low.bit_length() - 1, low, (low.bit_length() - 1,)))
+    while stack:
+        cell, visited, path = stack.pop()
+        depth = len(path)
+        if depth > last:
+            yield path
+            continue
+        candidates = neighbors[cell] & masks[depth] & ~visited
+        while candidates:
+            low = candidates & -candidates
+            candidates ^= low
+            next_cell = low.bit_length() - 1
+            stack.append((next_cell, visited | low, path + (next_cell,)))
+
+
+def scan_words(search: Search) -> Iterator[FoundWord]:
+    """
+    Yields every word in the search's grid by checking the dictionary words that fit the board
+    """
+    board = search.board
+    letters = letter_masks(board)
+    neighbors = neighbor_masks(board.width, board.height, board.blocked)
+    shifts = shift_masks(board.width, board.height, board.blocked)
+    for word in board_words(board, search.lexicon, search.max_length):
+        for path in word_paths(word, letters, neighbors, shifts):
+            yield FoundWord(word, path)
+
+
+# measured crossover (DFS time / scan time, 4 random boards per cell, trie lexicon):
+#
+#   distinct letters \ size   4x4   5x5   6x6   8x8  10x10  12x12
+#                    4        -    0.47  1.28  1.49  1.46   1.44
+#                    6      0.28   0.52  1.28  2.06  1.47   1.87
+#                    8      0.33   0.60  0.78  1.13  1.55   1.64
+#                   10      0.26   0.54  0.68  1.33  0.92   1.78
+#                   12+     0.31   0.50  0.46  0.61  0.64   0.82
+#
+# the scan only wins on big boards made of a handful of letters - and not on all of them: its cost
+# is about 3ms whatever the board, while the DFS costs about 0.02ms per open cell plus 0.007ms per
+# 3-cell path that starts a word (6x6-12x12 boards of 3-6 letters). A 6x6 board of vowels has almost
+# no such paths and solves in under 1ms, a 12x12 board of 'eltw' has ~1800 and takes 40ms.
+SCAN_MAX_LETTERS = 6 # most distinct letters a board can have for the scan to be picked
+SCAN_MIN_CELLS = 36 # fewest open cells a board needs for the scan to be picked
+SCAN_MIN_WORK = 140 # expected DFS work (open cells + 3-cell word-starting paths / 3) the scan needs to pay off
+
+
+def prefix_paths(board: Board, lexicon: Lexicon) -> float:
+    """
+    Estimates how many 3-cell paths on the board spell the start of a word - from the board's letter
+    counts and its cells' average neighbor count, so it takes (distinct letters)^3 lexicon steps
+    instead of walking the board
+    """
+    cells = board.cells
+    cell_count = len(board.open_cells)
+    counts: dict[int, int] = {}
+    for index in board.open_cells:
+        counts[cells[index]] = counts.get(cells[index], 0) + 1
+    degree = sum(len(board.neighbors[index]) for index in board.open_cells) / cell_count
+    paths = 0.0
+    for first, first_count in counts.items():
+        first_node = lexicon.child(lexicon.root, first)
+        if first_node is None:
+            continue
+        for second, second_count in counts.items():
+            second_node = lexicon.child(first_node, second)
+            if second_node is None:
+                continue
+            for third, third_count in counts.items():
+                if lexicon.child(second_node, third) is not None:
+                    paths += first_count * second_count * third_count
+    # each cell has about degree second cells and degree - 1 third cells, holding letters in proportion
+    return paths / cell_count ** 2 * degree * (degree - 1)
+
+
+def choose_engine(board: Board, lexicon: Lexicon) -> str:
+    """
+    Returns 'scan' for boards with few enough distinct letters and enough expected DFS work that the
+    dictionary scan beats the DFS, 'iterative' otherwise (always for boards with multi-letter tiles)
+    """
+    if board.tiles or len(board.open_cells) < SCAN_MIN_CELLS:
+        return 'iterative'
+    distinct_letters = len(set(board.cells[index] for index in board.open_cells))
+    if distinct_letters > SCAN_MAX_LETTERS:
+        return 'iterative'
+    work = len(board.open_cells) + prefix_paths(board, lexicon) / 3
+    return 'scan' if work >= SCAN_MIN_WORK else 'iterative'
@@ -0,0 +1,65 @@
+"""
+Contains the scoring models used to rank found words:
+
+- ScoringModel: interface - a word's score plus an upper bound for any word a prefix can still become
+- LengthScoring: points by word length - WORD_HUNT_SCORING is Word Hunt's table
+
+Notes:
+bound() is what lets Search.iter_best_words / Game.top_k stop early: branches are explored best
+bound first, so once a word scores at least the best remaining bound, no unexplored branch can beat it.
+Bounds must never be lower than a real score or the best words can be missed.
+"""
+
+
+class ScoringModel():
+    """
+    Interface shared by every scoring model
+    """
+
+    def score(self, word: str) -> int:
+        """
+        Returns the points a word is worth
+        """
+        raise NotImplementedError
+
+    def bound(self, prefix: str, max_letters: int) -> int:
+        """
+        Returns an upper bound on the score of any word starting with prefix and at most max_letters long
+        """
+        raise NotImplementedError
+
+
+class LengthScoring(ScoringModel):
+    """
+    Points by number of letters - words longer than the table earn extra_per_letter for each extra letter
+
+    {3: 100, 4: 400} -> 'cat' 100, 'coat' 400, 'coats' 400 + extra_per_letter
+    """
+    points: dict[int, int] # letters -> points
+    extra_per_letter: int # points per letter past the longest length in points
+
+    def __init__(self, points: dict[int, int], extra_per_letter: int = 0):
+        self.points = dict(points)
+        self.extra_per_letter = extra_per_letter
+        self._longest = max(self.points)
+        self._bounds: dict[tuple[int, int], int] = {}
+
+    def length_score(self, letters: int) -> int:
+        if letters > self._longest:
+            return self.points[self._longest] + (letters - self._longest) * self.extra_per_letter
+        return self.points.get(letters, 0)
+
+    def score(self, word: str) -> int:
+        return self.length_score(len(word))
+
+    def bound(self, prefix: str, max_letters: int) -> int:
+        key = (len(prefix), max_letters)
+        bound = self._bounds.get(key)
+        if bound is None:
+            bound = max((self.length_score(letters) for letters in range(len(prefix), max_letters + 1)), default=0)
+            self._bounds[key] = bound
+        return bound
+
+
+WORD_HUNT_SCORING = LengthScoring({3: 100, 4: 400, 5: 800, 6: 1400, 7: 1800, 8: 2200}, extra_per_letter=400)
+DEFAULT_SCORING = WORD_HUNT_SCORING
@@ -0,0 +1,308 @@
+"""
+Contains the solve service - a small asyncio HTTP/JSON server in front of the shared process pool:
+
+- ServiceError: a request that can't be served, with the HTTP status sent back
+- SolveService: admits, coalesces and times solves, running them on the process pool from Parallel.py
+- serve(): runs the HTTP server until cancelled
+- solve_remote(): client helper - posts a board to a running service
+- command line interface (python -m classes.Service --port 8765)
+
+Endpoints (JSON in, JSON out):
+POST /solve         {"board": [...], "paths": false}  -> one record (see Batch.result_record)
+POST /solve/batch   {"boards": [...], "paths": false} -> {"results": [record, ...]} in input order
+GET  /metrics       request counters, queue depth and latency percentiles
+GET  /health        {"status": "ok"}
+
+Notes:
+Boards are lists of columns, like Batch input lines (["cat", "dog"] / [["c", "a", "t"], ...]), with
+'.'/'#' for blocked cells. The lexicon is loaded once when the service is created; the pool's workers
+are forked from this process right away and share it, so the event loop itself never solves anything.
+
+Backpressure: at most max_pending boards are queued or running at once - a request that would go
+over gets 503 straight away instead of piling up. A request taking longer than timeout gets 504; its
+solve can't be stopped inside the worker, so it keeps counting as pending until it finishes.
+Invalid boards are refused with 400 before they reach the pool. If a worker dies, the requests
+waiting on it get 500 and the pool is replaced, so later requests are served again.
+A board that's already being solved (same board and paths flag) isn't solved again - every request
+for it waits on the one solve in flight.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from http import HTTPStatus
+from time import perf_counter
+
+from classes.Batch import normalize_board, solve_boards_in_worker
+from classes.Lexicon import DEFAULT_LEXICON, Lexicon, get_lexicon
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_URL = f'http://{DEFAULT_HOST}:{DEFAULT_PORT}'
+MAX_BODY_BYTES = 1 << 20
+LATENCY_WINDOW = 1000 # requests the latency percentiles are taken over
+
+
+class ServiceError(Exception):
+    """
+    A request that can't be served - status is the HTTP status code sent back
+    """
+    status: int
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class SolveService():
+    """
+    Solves boards on a process pool with backpressure, per-request timeouts and coalescing of identical boards
+
+    workers: pool processes - every CPU by default
+    max_pending: most boards queued or running at once - more are refused with 503
+    timeout: seconds a request may take before it gets 504
+    cache_size: solved boards cached per worker process - 0 disables the cache
+    """
+    lexicon: Lexicon # shared lexicon engine, inherited by the workers
+    workers: int # pool processes
+    pool: ProcessPoolExecutor # shared pool from Parallel.py - replaced if a worker dies
+    max_pending: int # most boards queued or running at once
+    timeout: float # seconds before a request gets 504
+    cache_size: int # solved boards cached per worker
+    pending: int # boards admitted and not finished - the queue depth
+    in_flight: dict[str, asyncio.Future] # coalescing key -> the solve every identical request waits on
+    counters: dict[str, int] # requests, boards, coalesced, rejected, timeouts, errors
+    latencies: deque[float] # seconds taken by the most recent requests
+
+    def __init__(self, workers: int | None = None, lexicon: str | Lexicon = DEFAULT_LEXICON,
+                 max_pending: int = 64, timeout: float = 30.0, cache_size: int = 1024):
+        from classes.Parallel import default_workers, get_pool
+        self.lexicon = get_lexicon(lexicon) if isinstance(lexicon, str) else lexicon
+        self.workers = workers or default_workers()
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self.pending = 0
+        self.in_flight = {}
+        self.counters = dict.fromkeys(('requests', 'boards', 'coalesced', 'rejected', 'timeouts', 'errors'), 0)
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        # forks the workers now, before any socket is open - a worker forked later would inherit
+        # client connections and keep them open after the server has closed them
+        self.pool = get_pool(self.workers, self.lexicon)
+        self.pool.submit(int).result()
+
+    def submit(self, boards: list[list[list[str]]], include_paths: bool) -> list[asyncio.Future]:
+        """
+        Returns a future per board, reusing the solve of any identical board in flight
+
+        The boards that need a new solve are admitted all together or not at all (ServiceError 503)
+        """
+        keys = [json.dumps([board, include_paths]) for board in boards]
+        new_boards = {key: board for key, board in zip(keys, boards) if key not in self.in_flight}
+        if self.pending + len(new_boards) > self.max_pending:
+            self.counters['rejected'] += 1
+            raise ServiceError(503, f"{self.pending} boards already pending - try again later")
+
+        loop = asyncio.get_running_loop()
+        for key, board in new_boards.items():
+            future = loop.run_in_executor(self.pool, solve_boards_in_worker, [board], include_paths, self.cache_size)
+            future.add_done_callback(partial(self._finished, key))
+            self.in_flight[key] = future
+            self.pending += 1
+        self.counters['coalesced'] += len(keys) - len(new_boards)
+        return [self.in_flight[key] for key in keys]
+
+    def _finished(self, key: str, future: asyncio.Future) -> None:
+        self.pending -= 1
+        del self.in_flight[key]
+        if not future.cancelled():
+            future.exception() # marks it retrieved when every waiter has timed out
+
+    async def solve(self, boards: list[list[list[str]]], include_paths: bool = False) -> list[dict]:
+        """
+        Solves boards on the pool - returns one record per board, in order (see Batch.result_record)
+        """
+        start_time = perf_counter()
+        self.counters['requests'] += 1
+        self.counters['boards'] += len(boards)
+        try:
+            futures = self.submit(boards, include_paths)
+            # shielded so a timed-out request doesn't cancel a solve other requests wait on
+            chunks = await asyncio.wait_for(asyncio.gather(*map(asyncio.shield, futures)), self.timeout)
+            return [records[0] for records in chunks]
+        except asyncio.TimeoutError:
+            self.counters['timeouts'] += 1
+            raise ServiceError(504, f"Solve took longer than {self.timeout} seconds") from None
+        except ServiceError:
+            raise
+        except BrokenProcessPool:
+            self.counters['errors'] += 1
+            self.replace_broken_pool()
+            raise ServiceError(500, "A worker process died - the pool has been restarted") from None
+        except Exception as error:
+            self.counters['errors'] += 1
+            raise ServiceError(500, f"Solve failed: {error!r}") from error
+        finally:
+            self.latencies.append(perf_counter() - start_time)
+
+    def replace_broken_pool(self) -> None:
+        """
+        Swaps the pool for a new one if a dead worker broke it - requests that saw the same pool break
+        find it already replaced
+        """
+        from classes.Parallel import discard_pool, get_pool
+        try:
+            self.pool.submit(int) # raises straight away on a broken pool
+        except BrokenProcessPool:
+            discard_pool(self.pool)
+            self.pool = get_pool(self.workers, self.lexicon)
+            # unlike in __init__, the new workers inherit the client connections open right now
+            self.pool.submit(int).result()
+
+    def metrics(self) -> dict:
+        """
+        Request counters, the current queue depth and latency percentiles (milliseconds) of recent requests
+        """
+        latencies = sorted(self.latencies)
+
+        def percentile(fraction: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000, 2)
+
+        return {
+            **self.counters,
+            'queue_depth': self.pending,
+            'max_pending': self.max_pending,
+            'workers': self.workers,
+            'latency_ms': {'p50': percentile(0.5), 'p95': percentile(0.95), 'p99': percentile(0.99), 'max': percentile(1.0)},
+        }
+
+    async def handle(self, method: str, path: str, body: bytes) -> dict:
+        """
+        Routes one request - returns the JSON response, raises ServiceError for anything but 200
+        """
+        if method == 'GET' and path == '/health':
+            return {'status': 'ok'}
+        if method == 'GET' and path == '/metrics':
+            return self.metrics()
+        if method != 'POST' or path not in ('/solve', '/solve/batch'):
+            raise ServiceError(404, f"No endpoint {method} {path}")
+
+        try:
+            request = json.loads(body)
+            include_paths = bool(request.get('paths', False))
+            if path == '/solve':
+                boards = [normalize_board(request['board'])]
+            else:
+                boards = [normalize_board(board) for board in request['boards']]
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            raise ServiceError(400, f"Bad request body: {error!r}") from None
+        records = await self.solve(boards, include_paths)
+        return records[0] if path == '/solve' else {'results': records}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serves one request per connection (Connection: close)
+        """
+        try:
+            try:
+                request = await read_request(reader)
+                if request is None:
+                    return
+                status, response = 200, await self.handle(*request)
+            except ServiceError as error:
+                status, response = error.status, {'error': str(error)}
+            payload = json.dumps(response).encode()
+            writer.write(
+                f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode()
+                + payload
+            )
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start_server(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.Server:
+        """
+        Starts listening - port 0 picks a free port (see server.sockets[0].getsockname())
+        """
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+
+async def read_request(reader: asyncio.StreamReader) -> tuple[str, str, bytes] | None:
+    """
+    Reads an HTTP request - returns (method, path without query string, body), None if the client sent nothing
+    """
+    try:
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        method, target, _ = request_line.decode('latin-1').split(' ', 2)
+        headers = {}
+        while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get('content-length', 0))
+        if length > MAX_BODY_BYTES:
+            raise ServiceError(413, f"Request bodies are limited to {MAX_BODY_BYTES} bytes")
+        body = await reader.readexactly(length) if length else b''
+    except (ValueError, asyncio.IncompleteReadError):
+        raise ServiceError(400, "Malformed HTTP request") from None
+    return method, target.split('?', 1)[0], body
+
+
+async def serve(service: SolveService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+    """
+    Serves requests until cancelled
+    """
+    server = await service.start_server(host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def solve_remote(board: list[list[str]], url: str = DEFAULT_URL, include_paths: bool = False,
+                 timeout: float | None = None) -> dict:
+    """
+    Posts a board to a running service - returns its record, raises ServiceError with the service's status on failure
+    """
+    import urllib.error
+    import urllib.request
+    data = json.dumps({'board': board, 'paths': include_paths}).encode()
+    http_request = urllib.request.Request(url.rstrip('/') + '/solve', data, {'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(http_request, timeout=timeout) as response:
+            return json.load(response)
+    except urllib.error.HTTPError as error:
+        raise ServiceError(error.code, json.load(error).get('error', error.reason)) from None
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m classes.Service', description="Serve POST /solve and /solve/batch over HTTP")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="interface to listen on - localhost by default")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="port to listen on")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="worker processes - every CPU by default")
+    parser.add_argument('--max-pending', type=int, default=64, help="boards queued or running before requests get 503")
+    parser.add_argument('--timeout', type=float, default=30.0, help="seconds before a request gets 504")
+    parser.add_argument('--lexicon', default=DEFAULT_LEXICON, help="lexicon backend (auto, dawg, trie, hash)")
+    parser.add_argument('--cache-size', type=int, default=1024, help="solved boards cached per worker - 0 disables the cache")
+    args = parser.parse_args(argv)
+
+    service = SolveService(args.workers, args.lexicon, args.max_pending, args.timeout, args.cache_size)
+    print(f"Serving on http://{args.host}:{args.port} with {service.workers} workers", file=sys.stderr)
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Contains the optional solver instrumentation:
+
+- SearchStats: DFS counters and per-phase timings for one search
+- InstrumentedLexicon: wraps a lexicon and counts every lookup the solver makes into a SearchStats
+- phase(): context manager timing a phase of a search into a SearchStats (no-op without one)
+
+Notes:
+Instrumentation is opt-in (find_words(stats=True)) and costs nothing when it's off - the counters
+live in a wrapper around the lexicon, so the solver's hot loop is the same either way.
+
+Counters cover sequential solves - searches run on a process pool or answered from a cache only
+record their phase timings.
+"""
+
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from typing import Iterator
+
+from classes.Lexicon import Lexicon
+
+
+class SearchStats():
+    """
+    Counters and timings for one search
+    """
+    nodes_expanded: int # lexicon lookups that extended a branch - one per DFS node entered
+    prefix_pruned: int # lexicon lookups that cut a branch - no word starts with the extended prefix
+    dictionary_hits: int # paths that spelled a word
+    duplicates_dropped: int # words not added to the results - repeated paths or, with unique_words, repeated words
+    phase_times: dict[str, float] # seconds spent in each phase, at perf_counter precision
+
+    def __init__(self):
+        self.nodes_expanded = 0
+        self.prefix_pruned = 0
+        self.dictionary_hits = 0
+        self.duplicates_dropped = 0
+        self.phase_times = {}
+
+    @property
+    def prune_rate(self) -> float:
+        """
+        Fraction of lexicon lookups that cut a branch
+        """
+        lookups = self.nodes_expanded + self.prefix_pruned
+        return self.prefix_pruned / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            'nodes_expanded': self.nodes_expanded,
+            'prefix_pruned': self.prefix_pruned,
+            'prune_rate': round(self.prune_rate, 4),
+            'dictionary_hits': self.dictionary_hits,
+            'duplicates_dropped': self.duplicates_dropped,
+            'phase_times': dict(self.phase_times),
+        }
+
+
+@contextmanager
+def timed(stats: SearchStats, name: str) -> Iterator[None]:
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        stats.phase_times[name] = stats.phase_times.get(name, 0.0) + perf_counter() - start
+
+
+def phase(stats: SearchStats | None, name: str):
+    """
+    Times the body of a with block into stats.phase_times[name] - does nothing if stats is None
+    """
+    return nullcontext() if stats is None else timed(stats, name)
+
+
+class InstrumentedLexicon(Lexicon):
+    """
+    Lexicon wrapper counting lookups into a SearchStats
+    """
+    lexicon: Lexicon # the wrapped lexicon
+    stats: SearchStats
+
+    def __init__(self, lexicon: Lexicon, stats: SearchStats):
+        self.lexicon = lexicon
+        self.stats = stats
+        self.root = lexicon.root
+        self.name = lexicon.name
+
+    def child(self, node, code: int):
+        next_node = self.lexicon.child(node, code)
+        if next_node is None:
+            self.stats.prefix_pruned += 1
+        else:
+            self.stats.nodes_expanded += 1
+        return next_node
+
+    def is_word(self, node) -> bool:
+        if self.lexicon.is_word(node):
+            self.stats.dictionary_hits += 1
+            return True
+        return False
+
+    def words(self):
+        return self.lexicon.words()
+
+    def max_suffix(self, node):
+        return self.lexicon.max_suffix(node)
+
+    @property
+    def fingerprint(self) -> str:
+        return self.lexicon.fingerprint
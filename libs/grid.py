@@ -1,20 +1,25 @@
-import random
-import string
 
+BLOCKED_CELL = '#' # typed into a cell to block it - see classes/Board.py
+MAX_TILE_LENGTH = 3 # most letters in one cell - multi-letter tiles like "qu"
+RANDOM_WORDS_PER_CELL = 2 # distinct words a randomized grid aims for, per cell - see classes/Generator.py
 
-def create_grid(st, n: int = 3):
-    return [['']*n]*n
+
+def create_grid(st, rows: int = 3, cols: int = 3):
+    return [['']*cols]*rows
 
 
 def submit_word_grid(st):
     """
     st: streamlit instance
-    updates session state with an n*n dictionary
+    updates session state with a rows*cols dictionary
     fails if the edited grid is empty or not all dimensions are edited properly.
+    cells holding BLOCKED_CELL are blocked - no word can use them
+    cells can hold multi-letter tiles (e.g. "qu") of up to MAX_TILE_LENGTH letters
     """
 
     grid: dict = st.session_state.get('temp_grid', None)
-    dim: int = st.session_state['grid_dim']
+    n_rows: int = st.session_state['grid_rows']
+    n_cols: int = st.session_state['grid_cols']
 
     if not grid:
         st.error("Please provide a grid.")
@@ -23,17 +28,17 @@ def submit_word_grid(st):
     edited_rows: dict = grid['edited_rows']
     rows = edited_rows.keys()
 
-    # fail if the number of edited rows or columns is != n
-    if len(rows) != dim:
-        st.error("Please insert one letter into each cell.")
+    # fail if the number of edited rows is != n_rows
+    if len(rows) != n_rows:
+        st.error(f"Please insert one letter or tile (or {BLOCKED_CELL} for a blocked cell) into each cell.")
         return
 
     # concurrently check if each row has the correct number of edited cells and load it into a new data structure
-    for i in range(0, dim):
-        for j in range(0, dim):
+    for i in range(0, n_rows):
+        for j in range(0, n_cols):
             cell = edited_rows[i].get(str(j), '')
-            if len(cell) != 1 or not cell.isalpha():
-                st.error("Please insert one letter into each cell.")
+            if not (cell == BLOCKED_CELL or (cell.isalpha() and 1 <= len(cell) <= MAX_TILE_LENGTH)):
+                st.error(f"Please insert one letter or tile (or {BLOCKED_CELL} for a blocked cell) into each cell.")
                 return
 
             edited_rows[i][str(j)] = str(cell).lower()
@@ -44,7 +49,8 @@ def submit_word_grid(st):
 def render_table(st):
     """Takes the grid element and plots it in streamlit instance"""
     grid = st.session_state['grid']
-    dim = st.session_state['grid_dim']
+    n_rows = st.session_state['grid_rows']
+    n_cols = st.session_state['grid_cols']
     html = """
         <style>
             table, th, td {
@@ -57,8 +63,8 @@ def render_table(st):
         <table style='width:100%' table-layout:'fixed' border='2'>
     """
 
-    for i in range(0, dim):
-        td = [f"<td>{grid[i][str(j)]}</td>" for j in range(0,dim)]
+    for i in range(0, n_rows):
+        td = [f"<td>{grid[i][str(j)]}</td>" for j in range(0, n_cols)]
         td = "".join(td)
         html += f"<tr>{td}</tr>"
 
@@ -68,14 +74,15 @@ def render_table(st):
 
 def render_colored_table(st):
     grid = st.session_state['grid']
-    dim = st.session_state['grid_dim']
-    longest_word = st.session_state['longest_word']
+    n_rows = st.session_state['grid_rows']
+    n_cols = st.session_state['grid_cols']
+    longest_path = st.session_state['longest_path']
 
     num_words_found = st.session_state['num_words_found']
     runtime = st.session_state['runtime']
     results_header = f"{num_words_found} word{'s' if num_words_found!=1 else ''} found in {runtime} seconds"
 
-    coords = [letter.coordinates for letter in longest_word]
+    coords = set(map(tuple, longest_path))
     html = """
         <style>
             table, th, td {
@@ -96,11 +103,13 @@ def render_colored_table(st):
             <table style='width:100%' table-layout:'fixed' border='2'>
         """
     html += f"<div class='header-right'>{results_header}</div>"
-    for i in range(0, dim):
+    for i in range(0, n_rows):
         td = []
-        for j in range(0, dim):
+        for j in range(0, n_cols):
             if (j, i) in coords:
                 td.append(f"<td bgcolor='pink' style='color:black'>{grid[i][str(j)]}</td>")
+            elif grid[i][str(j)] == BLOCKED_CELL:
+                td.append("<td bgcolor='gray'></td>")
             else:
                 td.append(f"<td>{grid[i][str(j)]}</td>")
         td = "".join(td)
@@ -113,32 +122,39 @@ def render_colored_table(st):
 def transform_grid(st):
     """Transforms grid from a row * column to a column * row struc"""
     grid = st.session_state['grid']
-    dim = st.session_state['grid_dim']
-    rows = []
+    n_rows = st.session_state['grid_rows']
+    n_cols = st.session_state['grid_cols']
+    columns = []
 
     print(grid)
 
-    for i in range(0,dim):
-        columns = []
-        for j in range(0,dim):
-            columns.append(grid[j][str(i)])
-        rows.append(columns)
-
-    st.session_state['grid_final'] = rows
-
+    for i in range(0, n_cols):
+        column = []
+        for j in range(0, n_rows):
+            column.append(grid[j][str(i)])
+        columns.append(column)
 
-def random_letter():
-    return random.choice(string.ascii_lowercase)
+    st.session_state['grid_final'] = columns
 
 
 def randomize_grid(st):
-    dim = st.session_state['grid_dim']
-    print(st.session_state['temp_grid'])
+    """
+    Fills the grid with letters drawn by English letter frequency, aiming for RANDOM_WORDS_PER_CELL
+    words per cell - falls back to a plain random board if none gets there in 50 draws
+    """
+    from classes.Generator import BoardGenerator
+    n_rows = st.session_state['grid_rows']
+    n_cols = st.session_state['grid_cols']
+    generator = BoardGenerator(min_words=RANDOM_WORDS_PER_CELL * n_rows * n_cols)
+    try:
+        columns = generator.generate(n_cols, n_rows, max_draws=50)
+    except ValueError:
+        columns = generator.draw(n_cols, n_rows)
     grid = {}
 
-    for row in range(0,dim):
+    for row in range(0, n_rows):
         grid[row] = {}
-        for col in range(0, dim):
-            grid[row][str(col)] = random_letter()
+        for col in range(0, n_cols):
+            grid[row][str(col)] = columns[col][row]
 
     st.session_state['grid'] = grid
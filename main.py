@@ -1,37 +1,82 @@
+import os
 import streamlit as st
 from libs import grid
 from classes import Nodes
+from classes.Batch import result_record
+from classes.Lexicon import Lexicon, get_lexicon
 
 st.set_page_config(
     page_title="WordHunt Solver App"
 )
 st.header("WordHunt Solver")
 st.caption("A Project by Luke Mileski & Filipp Kay")
-# st.session_state['grid_dim'] = 3
+# st.session_state['grid_rows'] = st.session_state['grid_cols'] = 3
+SERVICE_URL = os.environ.get('WORDHUNT_SERVICE_URL') # solve on a running classes.Service instead of in-process
+
+
+@st.cache_resource
+def load_lexicon() -> Lexicon:
+    """
+    The word list/lexicon - loaded once per server process and shared by every session
+    """
+    return get_lexicon()
+
+
+@st.cache_data(max_entries=1024)
+def solve(grid_final: tuple[tuple[str, ...], ...]) -> dict:
+    """
+    Solves a board (columns of characters) - repeated boards are answered from Streamlit's cache, across sessions
+
+    Returns a compact record (see Batch.result_record) rather than Letter/FoundWord objects - solved
+    in-process if the service can't be reached or fails
+    """
+    board = [list(column) for column in grid_final]
+    if SERVICE_URL:
+        from classes.Service import ServiceError, solve_remote
+        try:
+            return solve_remote(board, SERVICE_URL)
+        except (OSError, ServiceError) as error: # URLError is an OSError
+            st.warning(f"Solve service unavailable ({error}) - solving here instead")
+    return result_record(board, Nodes.Game(load_lexicon()).search(board))
+
+
+@st.cache_data(max_entries=1024)
+def solver_stats(grid_final: tuple[tuple[str, ...], ...]) -> dict:
+    """
+    Node counts and phase timings for a board - solved again with instrumentation, only when asked for (see Stats.py)
+    """
+    if SERVICE_URL:
+        return {} # solver stats stay in the service's workers
+    board = [list(column) for column in grid_final]
+    return Nodes.Game(load_lexicon()).search(board, stats=True).stats.as_dict() # type: ignore
 
 
 def reset():
-    for visual in ['grid', 'results', 'grid_final', 'grid_dim']:
+    for visual in ['grid', 'results', 'grid_final', 'grid_rows', 'grid_cols', 'longest_word', 'longest_path', 'score']:
         if visual in st.session_state:
             del st.session_state[visual]
 
 
 def init_dim():
-    st.session_state['grid_dim'] = st.session_state['grid_dim_tmp']
+    st.session_state['grid_rows'] = st.session_state['grid_rows_tmp']
+    st.session_state['grid_cols'] = st.session_state['grid_cols_tmp']
     return
 
 
 def main():
 
-    if not st.session_state.get('grid_dim', None):
-        st.number_input("Please enter the number of rows and columns (2-10).", key="grid_dim_tmp",
+    if not st.session_state.get('grid_rows', None):
+        st.number_input("Please enter the number of rows (2-10).", key="grid_rows_tmp",
+                        format='%d', min_value=2, max_value=10)
+        st.number_input("Please enter the number of columns (2-10).", key="grid_cols_tmp",
                         format='%d', min_value=2, max_value=10)
         st.button("Submit", on_click=init_dim)
         return
 
     if not st.session_state.get('grid'):
         st.subheader("Please edit the word grid and press continue.", divider='rainbow')
-        st.data_editor(grid.create_grid(st, st.session_state['grid_dim']), key="temp_grid")
+        st.caption(f"Enter {grid.BLOCKED_CELL} for a blocked cell - cells can hold tiles such as qu.")
+        st.data_editor(grid.create_grid(st, st.session_state['grid_rows'], st.session_state['grid_cols']), key="temp_grid")
         c1, c2, c3 = st.columns(3)
         with c1:
             st.button("Back", on_click=reset)
@@ -45,21 +90,14 @@ def main():
         print("transforming grid...")
         grid.transform_grid(st)
 
-    if not st.session_state.get('results', None):
-        game = Nodes.Game()
-        game.find_words(st.session_state['grid_final'])
-        st.session_state['results'] = list([])
-
-        longest_word = []
-
-        for results in game.all_search_results:
-            if len(longest_word) < len(results.longest_word):
-                longest_word = results.longest_word
-            st.session_state['results'] = results.words_by_character
-
-        st.session_state['longest_word'] = longest_word
-        st.session_state['num_words_found'] = len(results.words_by_character)
-        st.session_state['runtime'] = results.search_time
+    if 'results' not in st.session_state:
+        record = solve(tuple(tuple(column) for column in st.session_state['grid_final']))
+        st.session_state['results'] = record['words']
+        st.session_state['longest_word'] = record['longest_word']
+        st.session_state['longest_path'] = record['longest_path']
+        st.session_state['num_words_found'] = record['word_count']
+        st.session_state['runtime'] = record['search_time']
+        st.session_state['score'] = record['score']
 
     grid.render_colored_table(st)
     st.button("Reset", on_click=reset)
@@ -71,9 +109,12 @@ def main():
             st.caption(word)
     with c2:
         st.write("Longest Word")
-        lw = [letter.character for letter in st.session_state['longest_word']]
-        lw = "".join(lw)
-        st.caption(lw)
+        st.caption(st.session_state['longest_word'])
+        st.write("Points")
+        st.caption(str(st.session_state['score']))
+
+    if st.checkbox("Show solver stats"):
+        st.json(solver_stats(tuple(tuple(column) for column in st.session_state['grid_final'])))
 
 
 main()
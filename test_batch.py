@@ -0,0 +1,40 @@
+"""
+PyTests for the batch solve API in Batch.py
+"""
+
+import json
+import pytest
+from classes import Batch as batch
+from classes import Nodes as nodes
+
+
+def test_parse_board():
+    assert batch.parse_board('cat dog\n') == [['c', 'a', 't'], ['d', 'o', 'g']]
+    assert batch.parse_board('CAT,DOG') == [['c', 'a', 't'], ['d', 'o', 'g']]
+    assert batch.parse_board('["ca", "ot"]') == [['c', 'a'], ['o', 't']]
+    assert batch.parse_board('{"board": [["c", "a"], ["o", "t"]]}') == [['c', 'a'], ['o', 't']]
+    with pytest.raises(ValueError):
+        batch.parse_board('cat do')
+
+def test_solve_many_matches_find_words():
+    boards = [[['c', 'a'], ['o', 't']], [['a', 'b', 'c'], ['d', 'e', 'f'], ['g', 'h', 'i']]] * 3
+    new_game = nodes.Game()
+    for records in (list(batch.solve_many(boards, chunksize=2)), list(batch.solve_many(boards, workers=2, chunksize=2))):
+        assert len(records) == len(boards)
+        for board, record in zip(boards, records):
+            new_game.find_words(board)
+            assert record['words'] == new_game.all_search_results[-1].words_by_character
+            assert json.loads(json.dumps(record))['board'] == [''.join(column) for column in board]
+
+def test_main_skips_invalid_lines(tmp_path, capsys):
+    input_path, output_path = tmp_path / 'boards.txt', tmp_path / 'results.jsonl'
+    input_path.write_text('cat dog\ncat do\n\n{"boards": []}\nca ot\n')
+    batch.main([str(input_path), '-o', str(output_path), '-w', '1'])
+    records = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert [record['board'] for record in records] == [['cat', 'dog'], ['ca', 'ot']]
+    assert '2 invalid lines skipped' in capsys.readouterr().err
+
+def test_result_record_round_trips_tiles():
+    for board in ([['qu', 'i'], ['t', 'e']], [['c', 'a'], ['t', 's']]):
+        record = batch.result_record(board, nodes.Game().search(board))
+        assert batch.parse_board(json.dumps(record)) == board
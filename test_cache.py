@@ -0,0 +1,41 @@
+"""
+PyTests for the result cache in Cache.py
+"""
+
+from classes import Cache as cache
+from classes import Nodes as nodes
+
+
+def test_symmetries_share_entry():
+    grid = [['s', 't', 'a'], ['e', 'a', 't'], ['r', 'e', 's'], ['a', 't', 'e']] # 4 columns x 3 rows
+    rotated = [list(column) for column in zip(*grid)][::-1]
+    result_cache = cache.ResultCache()
+    cached_game = nodes.Game(cache=result_cache)
+    plain_game = nodes.Game()
+    for board in (grid, rotated, grid[::-1]):
+        cached_game.find_words(board)
+        plain_game.find_words(board)
+        assert sorted(cached_game.all_search_results[-1].words_found) == sorted(plain_game.all_search_results[-1].words_found)
+    assert result_cache.stats()['misses'] == 1
+    assert result_cache.stats()['hits'] == 2
+
+def test_lru_eviction_and_disk_tier(tmp_path):
+    path = str(tmp_path / 'results.sqlite')
+    result_cache = cache.ResultCache(maxsize=1, path=path)
+    new_game = nodes.Game(cache=result_cache)
+    new_game.find_words([['c', 'a'], ['o', 't']])
+    new_game.find_words([['d', 'o'], ['g', 's']])
+    assert result_cache.stats()['evictions'] == 1
+    new_game.find_words([['c', 'a'], ['o', 't']])
+    assert result_cache.stats()['disk_hits'] == 1
+    # a second cache over the same file starts warm
+    assert cache.ResultCache(path=path).get(nodes.Search([['d', 'o'], ['g', 's']]).board, new_game.lexicon) is not None
+
+def test_max_length_from_cache():
+    grid = [['s', 't', 'a', 'r'], ['e', 'a', 't', 's'], ['r', 'e', 's', 't'], ['a', 't', 'e', 's']]
+    new_game = nodes.Game(cache=cache.ResultCache())
+    new_game.find_words(grid)
+    new_game.find_words(grid, max_length=4, unique_words=True)
+    plain_game = nodes.Game()
+    plain_game.find_words(grid, max_length=4, unique_words=True)
+    assert new_game.all_search_results[-1].words_by_character == plain_game.all_search_results[-1].words_by_character
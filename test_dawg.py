@@ -0,0 +1,37 @@
+"""
+PyTests for the compiled DAWG format in Dawg.py
+"""
+
+import pytest
+from classes import Dawg as dawg
+from classes import Lexicon as lexicon
+
+
+def test_compile_and_load(tmp_path):
+    wordlist = tmp_path / 'words.txt'
+    wordlist.write_text('cat\ncats\ncater\ndog\ndogs\nat\n')
+    dawg_path = str(tmp_path / 'words.dawg')
+    dawg.compile_file(str(wordlist), dawg_path)
+
+    compiled = dawg.DawgLexicon.load(dawg_path)
+    assert compiled.source_crc32 == dawg.file_crc32(str(wordlist))
+    assert sorted(compiled.words()) == ['cat', 'cater', 'cats', 'dog', 'dogs']
+    assert 'cats' in compiled
+    assert 'cate' not in compiled
+    assert 'at' not in compiled
+    assert compiled.find('do') is not None
+    assert compiled.find('dx') is None
+
+def test_matches_trie():
+    words = sorted(lexicon.get_lexicon('trie').words())
+    compiled = dawg.DawgLexicon(dawg.compile_words(words))
+    assert sorted(compiled.words()) == words
+    trie = lexicon.get_lexicon('trie')
+    for prefix in ['', 'c', 'qu', 'zo', 'catastroph']:
+        assert compiled.max_suffix(compiled.find(prefix)) == trie.max_suffix(trie.find(prefix))
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / 'not_a.dawg'
+    path.write_bytes(b'\0' * 32)
+    with pytest.raises(ValueError):
+        dawg.DawgLexicon.load(str(path))
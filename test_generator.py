@@ -0,0 +1,34 @@
+"""
+PyTests for the random board generator in Generator.py
+"""
+
+import pytest
+from classes import Generator as generator
+from classes import Nodes as nodes
+
+
+def test_draw():
+    assert generator.BoardGenerator(seed=1).draw(3, 2) == generator.BoardGenerator(seed=1).draw(3, 2)
+    board = generator.BoardGenerator('dice', seed=2).draw(4, 4)
+    assert len(board) == 4 and all(len(column) == 4 for column in board)
+    faces = [face for column in board for face in column]
+    assert all(face.isalpha() and (len(face) == 1 or face == 'qu') for face in faces)
+    with pytest.raises(ValueError):
+        generator.BoardGenerator('klingon')
+
+@pytest.mark.parametrize('letters,max_repairs', [('english', 0), ('dice', 0), ('uniform', 3)])
+def test_generate_meets_targets(letters, max_repairs):
+    board_generator = generator.BoardGenerator(letters, min_words=25, min_longest=6, max_repairs=max_repairs, seed=3)
+    new_game = nodes.Game()
+    for board in board_generator.boards(4, 4, 3):
+        results = new_game.search(board)
+        assert len(results.words_by_character) >= 25 and len(results.longest_word.word) >= 6
+    assert board_generator.draws >= 3
+    with pytest.raises(ValueError):
+        generator.BoardGenerator(min_longest=5).generate(2, 2, max_draws=3)
+
+def test_iter_long_words():
+    grid = [['c', 'a', 't', 's'], ['o', 'r', 'e', 'd'], ['a', 'n', 'i', 'l'], ['s', 't', 'e', 'p']]
+    search = nodes.Search(grid)
+    expected = [found_word for found_word in search.iter_words() if len(found_word.word) >= 5]
+    assert expected and sorted(search.iter_long_words(5)) == sorted(expected)
@@ -0,0 +1,39 @@
+"""
+PyTests for the bounded search history in History.py
+"""
+
+import pytest
+from classes import Nodes as nodes
+from classes.History import SearchHistory
+
+
+GRIDS = [[['c', 'a'], ['o', 't']], [['d', 'o'], ['g', 's']], [['t', 'e'], ['a', 'r']], [['n', 'e'], ['s', 't']]]
+
+def test_keeps_last_results():
+    new_game = nodes.Game(history=SearchHistory(maxsize=2))
+    for grid in GRIDS:
+        new_game.find_words(grid)
+    history = new_game.all_search_results
+    assert len(history) == 2 and history.searches == 4
+    assert history[-1].words_by_character == nodes.Game().search(GRIDS[-1]).words_by_character
+    assert len(history[-100:]) == 2
+    assert history.total_words_found == sum(len(nodes.Game().search(grid).words_by_character) for grid in GRIDS)
+    assert len(history.longest_word.word) == max(len(nodes.Game().search(grid).longest_word.word) for grid in GRIDS)
+    assert history.averages()['words_found'] == history.total_words_found / 4
+
+@pytest.mark.parametrize('file_name', ['history.jsonl', 'history.sqlite'])
+def test_spill(tmp_path, file_name):
+    history = SearchHistory(maxsize=1, path=str(tmp_path / file_name))
+    new_game = nodes.Game(history=history)
+    for grid in GRIDS:
+        new_game.find_words(grid)
+    spilled = list(history.spilled())
+    assert history.spilled_count == len(spilled) == 3
+    assert spilled[0]['words'] == nodes.Game().search(GRIDS[0]).words_by_character
+    history.close()
+    with SearchHistory(path=str(tmp_path / file_name)) as reopened:
+        assert len(list(reopened.spilled())) == 3
+
+def test_spill_file_opened_lazily(tmp_path):
+    with SearchHistory(maxsize=1, path=str(tmp_path / 'history.jsonl')) as history:
+        assert list(history.spilled()) == [] and not (tmp_path / 'history.jsonl').exists()
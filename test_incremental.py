@@ -0,0 +1,31 @@
+"""
+PyTests for the incremental re-solve in Incremental.py
+"""
+
+from classes import Nodes as nodes
+
+
+def test_resolve_matches_full_solve():
+    grid = [['s', 't', 'r', 'a'], ['e', 'a', 'i', 'n'], ['r', 'l', 'e', 't'], ['s', 'e', 'd', 'o']]
+    new_game = nodes.Game()
+    first = new_game.resolve(grid)
+    assert first.removed == [] and first.added == new_game.all_search_results[-1].words_by_character
+
+    edits = [(1, 2, 'o'), (3, 3, 'e'), (0, 0, '.'), (0, 0, 'qu'), (2, 1, 'k')]
+    for x, y, character in edits:
+        previous_words = set(new_game.all_search_results[-1].words_by_character)
+        grid[x][y] = character
+        diff = new_game.resolve(grid)
+        results = new_game.all_search_results[-1]
+        full = nodes.Game().search(grid)
+        assert sorted(results.words_found) == sorted(full.words_found)
+        assert diff.changed_cells == (x * 4 + y,)
+        assert set(diff.added) == set(full.words_by_character) - previous_words
+        assert set(diff.removed) == previous_words - set(full.words_by_character)
+
+def test_resolve_new_shape():
+    new_game = nodes.Game()
+    new_game.resolve([['c', 'a'], ['o', 't']])
+    diff = new_game.resolve([['c', 'a', 't'], ['o', 'd', 'e']])
+    assert diff.changed_cells == tuple(range(6))
+    assert new_game.all_search_results[-1].words_by_character == nodes.Game().search([['c', 'a', 't'], ['o', 'd', 'e']]).words_by_character
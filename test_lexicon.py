@@ -0,0 +1,38 @@
+"""
+PyTests for the lexicon engines in Lexicon.py
+"""
+
+import pytest
+from classes import Lexicon as lexicon
+from classes import Nodes as nodes
+
+
+def test_TrieLexicon_lookups():
+    trie = lexicon.TrieLexicon(['cat', 'cater', 'dog', 'at'])
+    assert 'cat' in trie
+    assert 'cater' in trie
+    assert 'cate' not in trie # prefix only
+    assert 'at' not in trie # too short for the game
+    assert trie.find('ca') is not None
+    assert trie.find('cx') is None
+    assert sorted(trie.words()) == ['cat', 'cater', 'dog']
+
+def test_backends_agree():
+    trie = lexicon.get_lexicon('trie')
+    hash_lexicon = lexicon.get_lexicon('hash')
+    for prefix in ['pre', 'prefix', 'qz', 'aardv', 'zzzz']:
+        assert (trie.find(prefix) is None) == (hash_lexicon.find(prefix) is None)
+        assert (prefix in trie) == (prefix in hash_lexicon)
+
+def test_solver_backends_agree():
+    grid = [['a', 'c', 'c'], ['p', 'r', 'e'], ['d', 'e', 'd']]
+    trie_game = nodes.Game(lexicon='trie')
+    hash_game = nodes.Game(lexicon='hash')
+    trie_game.find_words(grid)
+    hash_game.find_words(grid)
+    assert trie_game.all_search_results[0].words_by_character == hash_game.all_search_results[0].words_by_character
+    assert len(trie_game.all_search_results[0].words_found) == len(hash_game.all_search_results[0].words_found)
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        lexicon.get_lexicon('bogus')
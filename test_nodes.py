@@ -5,7 +5,6 @@ All resultant data is manually checked with VS code's integrated debugger -
 done by setting breakpoints at ellipses (...)
 """
 
-from time import time
 import pytest
 from classes import Nodes as nodes
 from random import choice
@@ -17,6 +16,55 @@ def test_Search_constructor():
         list_of_neighbor_chars = [neighbor.character for neighbor in letter.neighbors]
         ... # checked with integrated debugger - set breakpoint
 
+def test_Search_neighbors():
+    new_search = nodes.Search([['a', 'b', 'c'], ['d', 'e', 'f'], ['g', 'h', 'i']])
+    corner, center = new_search.letters_1d[0], new_search.letters_1d[4]
+    assert [neighbor.character for neighbor in corner.neighbors] == ['b', 'd', 'e']
+    assert [neighbor.character for neighbor in center.neighbors] == ['a', 'b', 'c', 'd', 'f', 'g', 'h', 'i']
+    assert new_search.board.neighbors is nodes.Search([['x'] * 3] * 3).board.neighbors # cached per grid size
+
+def test_rectangular_and_blocked():
+    grid = [['c', 'a', 't'], ['o', 'd', 'e'], ['g', 's', 'x'], ['t', 'r', 'e']]
+    blocked_grid = [['c', '.', 't'], ['o', '#', 'e'], ['g', 's'], ['t', 'r', 'e']]
+    board = nodes.Search(blocked_grid).board
+    assert (board.width, board.height) == (4, 3)
+    assert board.open_cells == (0, 2, 3, 5, 6, 7, 9, 10, 11)
+    assert board.neighbors[1] == () and 1 not in board.neighbors[0]
+    assert board.to_2d()[2] == ['g', 's', '']
+    assert nodes.Search([['x'] * 3] * 4).board.neighbors is nodes.Search(grid).board.neighbors # cached per size
+    # blocked patterns aren't cached - boards from outside can have any number of them
+    from classes.Board import grid_neighbor_table
+    cached_tables = grid_neighbor_table.cache_info().currsize
+    assert nodes.Search([['x', '', 'x'], ['x', None, 'x'], ['x', 'x'], ['x'] * 3]).board.neighbors == board.neighbors
+    assert grid_neighbor_table.cache_info().currsize == cached_tables
+
+    new_game = nodes.Game()
+    full = new_game.search(grid)
+    blocked = new_game.search(blocked_grid)
+    assert 'coated' in full.words_by_character
+    assert blocked.words_found and all(index in board.open_cells for _, path in blocked.words_found for index in path)
+    assert set(blocked.words_found) == {found_word for found_word in full.words_found if not {1, 4, 8} & set(found_word.path)}
+
+def test_multi_letter_tiles():
+    grid = [['qu', 'e', 'e'], ['i', 'n', 's'], ['t', '#', 't']]
+    new_game = nodes.Game()
+    results = new_game.search(grid)
+    assert {'quest', 'queen', 'inquest'} <= set(results.words_by_character)
+    assert results.longest_word == nodes.FoundWord('inquest', (3, 4, 0, 1, 5, 8)) # 7 letters, 6 cells
+    assert new_game.search(grid, engine='recursive').words_found == results.words_found
+    capped = new_game.search(grid, max_length=5)
+    assert set(capped.words_by_character) == {word for word in results.words_by_character if len(word) <= 5}
+
+def test_dictionary_shared():
+    first_game = nodes.Game()
+    second_game = nodes.Game()
+    new_search = nodes.Search([['c', 'a'], ['o', 't']])
+    assert first_game.dictionary is second_game.dictionary
+    assert first_game.lexicon is second_game.lexicon is new_search.lexicon
+    assert 'coat' in first_game.dictionary
+    with pytest.raises(AttributeError):
+        first_game.dictionary.words = frozenset()
+
 def test_recursive_solver_1():
     new_game = nodes.Game()
     grid = [['a']]
@@ -29,6 +77,93 @@ def test_recursive_solver_2():
     new_game.find_words(grid)
     ... # checked with integrated debugger - set breakpoint
 
+def test_found_word_paths():
+    new_game = nodes.Game()
+    grid = [['c', 'a'], ['o', 't']]
+    new_game.find_words(grid)
+    results = new_game.all_search_results[-1]
+    for found_word in results.words_found:
+        spelled = ''.join(grid[x][y] for x, y in results.coordinates(found_word.path))
+        assert spelled == found_word.word
+    assert 'coat' in results.words_by_character
+    assert len(results.longest_word.path) == max(len(word.path) for word in results.words_found)
+    assert results.words_by_coordinates == [results.coordinates(word.path) for word in results.words_found]
+    assert not results.paths_seen # only needed while the search runs
+
+def test_unique_words():
+    grid = [['a', 'c', 'c'], ['p', 'r', 'e'], ['d', 'e', 'd']]
+    new_game = nodes.Game()
+    new_game.find_words(grid)
+    new_game.find_words(grid, unique_words=True)
+    all_paths, unique = new_game.all_search_results
+    assert len(set(word.path for word in all_paths.words_found)) == len(all_paths.words_found)
+    assert len(unique.words_found) == len(unique.words_by_character) < len(all_paths.words_found)
+    assert unique.words_by_character == all_paths.words_by_character
+
+def test_engines_agree():
+    grid = [['s', 't', 'a', 'r'], ['e', 'a', 't', 's'], ['r', 'e', 's', 't'], ['a', 't', 'e', 's']]
+    new_game = nodes.Game()
+    new_game.find_words(grid, engine='recursive')
+    new_game.find_words(grid, engine='iterative')
+    recursive, iterative = new_game.all_search_results
+    assert recursive.words_found == iterative.words_found
+    assert recursive.longest_word == iterative.longest_word
+
+def test_scan_engine():
+    from classes.Scan import choose_engine
+    grid = [['s', 't', 'a', 'r'], ['e', 'a', 't', 's'], ['r', 'e', 's', 't'], ['a', 't', 'e', 's']]
+    new_game = nodes.Game()
+    for max_length in (None, 5):
+        iterative = new_game.search(grid, engine='iterative', max_length=max_length)
+        scan = new_game.search(grid, engine='scan', max_length=max_length)
+        assert sorted(scan.words_found) == sorted(iterative.words_found)
+        assert scan.words_by_character == iterative.words_by_character
+    big_dense = [[choice('aerst') for _ in range(8)] for _ in range(8)]
+    vowels = [[choice('aeiou') for _ in range(6)] for _ in range(6)]
+    lexicon = new_game.lexicon
+    assert choose_engine(nodes.Search(big_dense).board, lexicon) == 'scan'
+    assert choose_engine(nodes.Search(grid).board, lexicon) == 'iterative'
+    assert choose_engine(nodes.Search(vowels).board, lexicon) == 'iterative' # few words - the DFS is cheaper
+    assert sorted(new_game.search(big_dense).words_found) == sorted(new_game.search(big_dense, engine='iterative').words_found)
+
+def test_max_length():
+    grid = [['s', 't', 'a', 'r'], ['e', 'a', 't', 's'], ['r', 'e', 's', 't'], ['a', 't', 'e', 's']]
+    new_game = nodes.Game()
+    for engine in nodes.ENGINES:
+        new_game.find_words(grid, engine=engine, max_length=4)
+        assert max(len(word.path) for word in new_game.all_search_results[-1].words_found) == 4
+    with pytest.raises(ValueError):
+        new_game.find_words(grid, engine='bogus')
+
+def test_parallel_matches_sequential():
+    grid = [['s', 't', 'a', 'r'], ['e', 'a', 't', 's'], ['r', 'e', 's', 't'], ['a', 't', 'e', 's']]
+    new_game = nodes.Game()
+    new_game.find_words(grid)
+    new_game.find_words(grid, workers=2, chunksize=3)
+    sequential, parallel = new_game.all_search_results
+    assert sequential.words_found == parallel.words_found
+    assert sequential.longest_word == parallel.longest_word
+
+def test_iter_words():
+    grid = [['s', 't', 'a', 'r'], ['e', 'a', 't', 's'], ['r', 'e', 's', 't'], ['a', 't', 'e', 's']]
+    new_game = nodes.Game()
+    new_game.find_words(grid)
+    results = new_game.all_search_results[-1]
+    assert list(new_game.iter_words(grid)) == results.words_found
+    assert list(new_game.iter_words(grid, limit=5)) == results.words_found[:5]
+    longest = list(nodes.iter_words(grid, longest_first=True, limit=3))
+    assert longest[0] == results.longest_word
+    assert [len(word.path) for word in longest] == sorted([len(word.path) for word in results.words_found], reverse=True)[:3]
+    assert sorted(word.word for word in nodes.iter_words(grid, unique_words=True)) == results.words_by_character
+
+def test_board_words():
+    from classes import Pruning as pruning
+    grid = [['c', 'a'], ['o', 't']]
+    words = pruning.board_words(nodes.Search(grid).board, nodes.Game().lexicon)
+    assert 'coat' in words
+    assert 'toot' not in words # only one o
+    assert all(set(word) <= set('coat') for word in words)
+
 def test_recursive_solver_3():
     new_game = nodes.Game()
     grid = [['a', 'b', 'c'], ['d', 'e', 'f'], ['g', 'h', 'i']]
@@ -47,18 +182,50 @@ def test_recursive_solver_4():
     new_game.find_words(grid)
     ... # checked with integrated debugger - set breakpoint
 
+def test_stats():
+    new_game = nodes.Game()
+    grid = [['c', 'a', 't', 's'], ['d', 'o', 'g', 's'], ['t', 'r', 'e', 'e'], ['l', 'a', 'n', 'e']]
+    # only the search that looked the lexicon up reports it
+    assert 'create_hashes' in new_game.search(grid, stats=True).stats.phase_times
+    plain = new_game.search(grid)
+    assert plain.stats is None
+    for engine in ('iterative', 'recursive'):
+        results = new_game.search(grid, engine=engine, unique_words=True, stats=True)
+        stats = results.stats
+        assert stats.dictionary_hits == len(plain.words_found)
+        assert stats.dictionary_hits - stats.duplicates_dropped == len(results.words_found)
+        assert stats.nodes_expanded > 0 and 0 < stats.prune_rate < 1
+        assert {'search_setup', 'solve', 'finish'} <= set(stats.phase_times) and 'create_hashes' not in stats.phase_times
+
+def test_scoring():
+    from classes.Scoring import WORD_HUNT_SCORING, LengthScoring
+    assert [WORD_HUNT_SCORING.score('x' * letters) for letters in range(2, 11)] == [0, 100, 400, 800, 1400, 1800, 2200, 2600, 3000]
+    results = nodes.Game().search([['c', 'a'], ['o', 't']])
+    assert results.score == sum(WORD_HUNT_SCORING.score(word) for word in results.words_by_character)
+    assert results.best_word.word == results.longest_word.word
+    flat = nodes.Game(scoring=LengthScoring({3: 1})).search([['c', 'a'], ['o', 't']])
+    assert flat.score == len(flat.words_by_character)
+
+def test_top_k():
+    grid = [['s', 't', 'r', 'a'], ['e', 'a', 'i', 'n'], ['r', 'l', 'e', 't'], ['s', 'e', 'd', 'o']]
+    new_game = nodes.Game()
+    full = new_game.search(grid)
+    best_scores = sorted((new_game.scoring.score(word) for word in full.words_by_character), reverse=True)
+    for k in (1, 5, 20):
+        top = new_game.top_k(grid, k)
+        assert [new_game.scoring.score(found_word.word) for found_word in top.words_found] == best_scores[:k]
+        assert top.words_by_character == sorted(found_word.word for found_word in top.words_found)
+        assert len(top.words_by_character) == k and set(top.words_found) <= set(full.words_found)
+    assert len(nodes.top_k(grid, 10 ** 6).words_found) == len(full.words_by_character)
+
 def test_recursive_solver_5():
-    start_time = time()
     new_game = nodes.Game()
     grid = [['a', 'b', 'c', 'd', 'e'], ['b', 'c', 'd', 'e', 'f'], ['c', 'd', 'e', 'f', 'g'], ['d', 'e', 'f', 'g', 'h'], ['e', 'f', 'g', 'h', 'i']]
     new_game.find_words(grid)
-    final_time = time()
-    actual_completion_time = final_time - start_time
-    ... # time/accuracy checked with integrated debugger - set breakpoint
-    # ~0.85 seconds
+    ... # accuracy checked with integrated debugger - set breakpoint
+    # timing lives in benchmarks/bench_solver.py
 
 def test_recursive_solver_10():
-    start_time = time()
     new_game = nodes.Game()
     grid = [
             ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j'], # confusing - these are actually columns
@@ -73,10 +240,8 @@ def test_recursive_solver_10():
             ['j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's']
             ]
     new_game.find_words(grid)
-    final_time = time()
-    actual_completion_time = final_time - start_time
-    ... # time/accuracy checked with integrated debugger - set breakpoint
-    # ~6.4 seconds - not too shabby
+    ... # accuracy checked with integrated debugger - set breakpoint
+    # timing lives in benchmarks/bench_solver.py
 
 def test_averages():
     new_game = nodes.Game()
@@ -0,0 +1,35 @@
+"""
+PyTests for the NumPy batch prefilter in Prefilter.py
+"""
+
+import random
+import pytest
+from classes import Batch as batch
+from classes import Board as board
+from classes import Nodes as nodes
+
+np = pytest.importorskip('numpy')
+from classes import Prefilter as prefilter
+
+
+def test_solve_boards_matches_search():
+    rng = random.Random(7)
+    boards = [[[rng.choice('aeirstnlo') for _ in range(4)] for _ in range(4)] for _ in range(5)]
+    boards.append([['c', '#', 't'], ['a', 'o', 's'], ['t', 'e', 'r']])
+    boards.append([['qu', 'i'], ['t', 'e']])
+    new_game = nodes.Game()
+    for board, results in zip(boards, prefilter.solve_boards(boards, new_game)):
+        expected = new_game.search(board)
+        assert results.words_by_character == expected.words_by_character
+        assert sorted(results.words_found) == sorted(expected.words_found)
+
+def test_board_features():
+    encoded = prefilter.encode_boards([board.Board([['a', 'b'], ['c', '.']])])
+    counts, present = prefilter.board_features(encoded, 2, 2)
+    assert counts[0, :4].tolist() == [1, 1, 1, 0]
+    assert present[0, 0 * 27 + 1] and present[0, 2 * 27 + 1] and not present[0, 0 * 27 + 0]
+
+def test_solve_many_prefilter():
+    boards = [[['c', 'a'], ['o', 't']], [['a', 'b', 'c'], ['d', 'e', 'f'], ['g', 'h', 'i']]] * 2
+    assert [record['words'] for record in batch.solve_many(boards, prefilter=True)] == \
+        [record['words'] for record in batch.solve_many(boards)]
@@ -0,0 +1,81 @@
+"""
+PyTests for the asyncio solve service in Service.py
+"""
+
+import asyncio
+import json
+import pytest
+from classes import Nodes as nodes
+from classes import Service as service
+
+
+async def request(port: int, method: str, path: str, body: dict | None = None) -> tuple[int, dict]:
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    payload = json.dumps(body).encode() if body is not None else b''
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(payload)}\r\n\r\n".encode() + payload)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body_bytes = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(body_bytes)
+
+
+def test_endpoints():
+    boards = [['ca', 'ot'], ['abc', 'def', 'ghi']]
+
+    async def run():
+        solve_service = service.SolveService(workers=1)
+        server = await solve_service.start_server(port=0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            single, batch = await asyncio.gather(
+                request(port, 'POST', '/solve', {'board': boards[0]}),
+                request(port, 'POST', '/solve/batch', {'boards': boards + boards}),
+            )
+            bad = await request(port, 'POST', '/solve', {'board': ['ab', 'c']})
+            missing = await request(port, 'GET', '/nowhere')
+            metrics = await request(port, 'GET', '/metrics')
+        return single, batch, bad, missing, metrics
+
+    single, batch, bad, missing, (status, metrics) = asyncio.run(run())
+    new_game = nodes.Game()
+    assert single[0] == 200 and single[1]['words'] == new_game.search(boards[0]).words_by_character
+    assert batch[0] == 200 and [record['words'] for record in batch[1]['results']] == \
+        [new_game.search(board).words_by_character for board in boards + boards]
+    assert bad[0] == 400 and missing[0] == 404
+    assert status == 200 and metrics['requests'] == 2 and metrics['coalesced'] >= 2 and metrics['queue_depth'] == 0
+
+def test_backpressure_and_timeout():
+    board = [list('sert'), list('aing'), list('olpe'), list('mnud')]
+
+    async def run():
+        solve_service = service.SolveService(workers=1, max_pending=1, timeout=0, cache_size=0)
+        with pytest.raises(service.ServiceError) as busy:
+            await solve_service.solve([board, [list('ca'), list('ot')]])
+        with pytest.raises(service.ServiceError) as slow:
+            await solve_service.solve([board])
+        while solve_service.pending:
+            await asyncio.sleep(0.01)
+        return busy.value.status, slow.value.status, solve_service.metrics()
+
+    busy, slow, metrics = asyncio.run(run())
+    assert (busy, slow) == (503, 504)
+    assert metrics['rejected'] == 1 and metrics['timeouts'] == 1
+
+def test_invalid_board_and_dead_worker():
+    import os
+    import signal
+    too_many_tiles = [[f'x{n}' for n in range(130)]]
+
+    async def run():
+        solve_service = service.SolveService(workers=1, cache_size=0)
+        with pytest.raises(service.ServiceError) as invalid:
+            await solve_service.handle('POST', '/solve', json.dumps({'board': too_many_tiles}).encode())
+        os.kill(solve_service.pool.submit(os.getpid).result(), signal.SIGKILL)
+        with pytest.raises(service.ServiceError) as died:
+            await solve_service.solve([[list('ca'), list('ot')]])
+        return invalid.value.status, died.value.status, await solve_service.solve([[list('ca'), list('ot')]])
+
+    invalid, died, records = asyncio.run(run())
+    assert (invalid, died) == (400, 500)
+    assert 'coat' in records[0]['words']